@@ -0,0 +1,130 @@
+import functools
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pytest
+from playwright.sync_api import BrowserContext, Locator, Page, Route
+from pytest_benchmark.utils import parse_compare_fail
+
+from pages.base_page import BasePage
+
+# Static copy of the Swag Labs pages with the same ids and classes as the live site
+SITE_DIR = Path(__file__).parent / "site"
+
+# Committed page object benchmark results every run is compared against
+BASELINE = Path(__file__).parent / "baselines" / "page_objects.json"
+
+# Regression that fails a benchmark run against the baseline
+BASELINE_COMPARE_FAIL = "mean:15%"
+
+# Page and Locator methods of the page objects that send a message to the browser
+PAGE_CALLS = ("goto", "click", "fill", "select_option", "text_content", "evaluate",
+              "wait_for_url", "wait_for_function")
+LOCATOR_CALLS = ("click", "fill", "select_option", "text_content", "all_text_contents",
+                 "count", "is_visible", "wait_for", "evaluate", "evaluate_all", "evaluate_handle")
+
+# Rows for the flow comparison table: (flow, variant, round trips, seconds per run)
+_flow_results = []
+
+class FlowMeter:
+    """
+    Measures browser calls and wall time of a page object flow
+
+    Calls are counted at the public Page and Locator methods page objects use
+    to talk to the browser, each of which is one round trip to the Playwright driver.
+    """
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch):
+        self.calls = 0
+        for cls, names in ((Page, PAGE_CALLS), (Locator, LOCATOR_CALLS)):
+            for name in names:
+                monkeypatch.setattr(cls, name, self._counted(getattr(cls, name)))
+
+    def _counted(self, method):
+        """
+        Wrap a Page or Locator method so every call is counted
+        """
+        @functools.wraps(method)
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return method(*args, **kwargs)
+        return counted
+
+    def measure(self, flow, prepare, runs: int = 5):
+        """
+        Run prepare + flow several times and return (round trips, mean seconds) of flow
+        """
+        round_trips, elapsed = 0, 0.0
+        for _ in range(runs):
+            prepare()
+            first_call = self.calls
+            start = time.perf_counter()
+            flow()
+            elapsed += time.perf_counter() - start
+            round_trips += self.calls - first_call
+        return round_trips / runs, elapsed / runs
+
+    def record(self, name: str, variant: str, round_trips: float, seconds: float):
+        """
+        Add a measurement to the comparison table
+        """
+        _flow_results.append((name, variant, round_trips, seconds))
+
+def pytest_configure(config):
+    """
+    Compare benchmarks with the committed baseline unless the run sets its own comparison
+
+    A run that writes its JSON report to the baseline file refreshes it and is not compared.
+    """
+    report = config.getoption("benchmark_json")
+    if config.getoption("benchmark_compare") or (report and Path(report.name).resolve() == BASELINE.resolve()):
+        return
+    if not BASELINE.is_file():
+        return
+    config.option.benchmark_compare = str(BASELINE)
+    if not config.getoption("benchmark_compare_fail"):
+        config.option.benchmark_compare_fail = [parse_compare_fail(BASELINE_COMPARE_FAIL)]
+
+def serve_local_site(route: Route):
+    """
+    Fulfil a Swag Labs request from the local fixture site
+    """
+    path = urlsplit(route.request.url).path
+    file = SITE_DIR / ("index.html" if path == "/" else path.lstrip("/"))
+    if file.is_file():
+        route.fulfill(path=file)
+    else:
+        route.fulfill(status=404, body="Not Found")
+
+@pytest.fixture(autouse=True)
+def local_site(context: BrowserContext):
+    """
+    Serve the page object base URL from the local fixture site, with no network
+    """
+    context.route(f"{BasePage.BASE_URL}/**", serve_local_site)
+
+@pytest.fixture
+def flow_meter(monkeypatch: pytest.MonkeyPatch):
+    """
+    Round trip and latency meter over the page and locator calls of the test
+    """
+    return FlowMeter(monkeypatch)
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Print round trips and latency per flow and variant, and a note when there is no baseline
+    """
+    if not BASELINE.is_file():
+        terminalreporter.write_line(
+            f"No benchmark baseline at {BASELINE}, record one with --benchmark-json={BASELINE}",
+            yellow=True,
+        )
+    if not _flow_results:
+        return
+    terminalreporter.section("flow round trips")
+    terminalreporter.write_line(f"{'flow':<22} {'variant':<12} {'round trips':>11} {'latency (ms)':>12}")
+    for name, variant, round_trips, seconds in _flow_results:
+        terminalreporter.write_line(
+            f"{name:<22} {variant:<12} {round_trips:>11.1f} {seconds * 1000:>12.1f}"
+        )
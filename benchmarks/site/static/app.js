@@ -0,0 +1,159 @@
+// Static stand-in for the Swag Labs single page app, with the same ids and classes
+const PRODUCTS = [
+  { id: 4, name: "Sauce Labs Backpack", price: 29.99 },
+  { id: 0, name: "Sauce Labs Bike Light", price: 9.99 },
+  { id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99 },
+  { id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99 },
+  { id: 2, name: "Sauce Labs Onesie", price: 7.99 },
+  { id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99 },
+];
+const USERS = ["standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+const PASSWORD = "secret_sauce";
+
+const slug = (product) => product.name.toLowerCase().replace(/ /g, "-");
+const byId = (id) => PRODUCTS.find((product) => product.id === id);
+const getCart = () => JSON.parse(localStorage.getItem("cart-contents") || "[]");
+const setCart = (cart) => localStorage.setItem("cart-contents", JSON.stringify(cart));
+const loggedIn = () => document.cookie.split("; ").some((cookie) => cookie.startsWith("session-username="));
+
+function showError(message) {
+  document.querySelector(".error-message-container").innerHTML =
+    `<h3 data-test="error">Epic sadface: ${message}</h3>`;
+}
+
+function renderBadge() {
+  const link = document.querySelector(".shopping_cart_link");
+  const count = getCart().length;
+  link.innerHTML = count ? `<span class="shopping_cart_badge">${count}</span>` : "";
+}
+
+function cartButton(product) {
+  const inCart = getCart().includes(product.id);
+  const id = `${inCart ? "remove" : "add-to-cart"}-${slug(product)}`;
+  return `<button id="${id}" data-product="${product.id}">${inCart ? "Remove" : "Add to cart"}</button>`;
+}
+
+function itemHtml(product, wrapper) {
+  return `<div class="${wrapper}">
+    <a id="item_${product.id}_title_link" href="/inventory-item.html?id=${product.id}">
+      <div class="inventory_item_name">${product.name}</div>
+    </a>
+    <div class="inventory_item_price">$${product.price.toFixed(2)}</div>
+    ${wrapper === "inventory_item" || wrapper === "cart_item" ? cartButton(product) : ""}
+  </div>`;
+}
+
+function toggleCart(event) {
+  const button = event.target.closest("button[data-product]");
+  if (!button) return;
+  const id = Number(button.dataset.product);
+  const cart = getCart();
+  setCart(cart.includes(id) ? cart.filter((item) => item !== id) : [...cart, id]);
+  render();
+}
+
+const SORTS = {
+  az: (a, b) => a.name.localeCompare(b.name),
+  za: (a, b) => b.name.localeCompare(a.name),
+  lohi: (a, b) => a.price - b.price,
+  hilo: (a, b) => b.price - a.price,
+};
+
+const PAGES = {
+  "/": () => {
+    document.getElementById("login-form").addEventListener("submit", (event) => {
+      event.preventDefault();
+      const username = document.getElementById("user-name").value;
+      const password = document.getElementById("password").value;
+      if (!username) return showError("Username is required");
+      if (!password) return showError("Password is required");
+      if (!USERS.includes(username) || password !== PASSWORD) {
+        return showError("Username and password do not match any user in this service");
+      }
+      document.cookie = `session-username=${username}; path=/`;
+      location.href = "/inventory.html";
+    });
+  },
+  "/inventory.html": () => {
+    const sort = document.querySelector(".product_sort_container");
+    const list = document.querySelector(".inventory_list");
+    const draw = () => {
+      list.innerHTML = [...PRODUCTS].sort(SORTS[sort.value])
+        .map((product) => itemHtml(product, "inventory_item")).join("");
+    };
+    sort.onchange = draw;
+    list.onclick = toggleCart;
+    draw();
+  },
+  "/inventory-item.html": () => {
+    const product = byId(Number(new URLSearchParams(location.search).get("id")));
+    document.querySelector(".inventory_details").innerHTML =
+      `<div class="inventory_details_name">${product.name}</div>
+       <div class="inventory_details_price">$${product.price.toFixed(2)}</div>`;
+  },
+  "/cart.html": () => {
+    const list = document.querySelector(".cart_list");
+    list.innerHTML = getCart().map((id) => itemHtml(byId(id), "cart_item")).join("");
+    list.onclick = toggleCart;
+    document.getElementById("continue-shopping").onclick = () => { location.href = "/inventory.html"; };
+    document.getElementById("checkout").onclick = () => { location.href = "/checkout-step-one.html"; };
+  },
+  "/checkout-step-one.html": () => {
+    document.getElementById("cancel").onclick = () => { location.href = "/cart.html"; };
+    document.getElementById("checkout-form").addEventListener("submit", (event) => {
+      event.preventDefault();
+      if (!document.getElementById("first-name").value) return showError("First Name is required");
+      if (!document.getElementById("last-name").value) return showError("Last Name is required");
+      if (!document.getElementById("postal-code").value) return showError("Postal Code is required");
+      location.href = "/checkout-step-two.html";
+    });
+  },
+  "/checkout-step-two.html": () => {
+    const items = getCart().map(byId);
+    const subtotal = items.reduce((total, product) => total + product.price, 0);
+    const tax = Math.round(subtotal * 8) / 100;
+    document.querySelector(".cart_list").innerHTML = items.map((product) => itemHtml(product, "cart_item")).join("");
+    document.querySelector(".summary_subtotal_label").textContent = `Item total: $${subtotal.toFixed(2)}`;
+    document.querySelector(".summary_tax_label").textContent = `Tax: $${tax.toFixed(2)}`;
+    document.querySelector(".summary_total_label").textContent = `Total: $${(subtotal + tax).toFixed(2)}`;
+    document.getElementById("cancel").onclick = () => { location.href = "/inventory.html"; };
+    document.getElementById("finish").onclick = () => {
+      setCart([]);
+      location.href = "/checkout-complete.html";
+    };
+  },
+  "/checkout-complete.html": () => {
+    document.getElementById("back-to-products").onclick = () => { location.href = "/inventory.html"; };
+  },
+};
+
+function render() {
+  if (document.querySelector(".shopping_cart_link")) renderBadge();
+  if (location.pathname === "/inventory.html") {
+    document.querySelectorAll(".inventory_item button[data-product]").forEach((button) => {
+      button.outerHTML = cartButton(byId(Number(button.dataset.product)));
+    });
+  } else if (location.pathname === "/cart.html") {
+    PAGES["/cart.html"]();
+  }
+}
+
+function start() {
+  if (location.pathname !== "/" && !loggedIn()) {
+    location.href = "/";
+    return;
+  }
+  const menu = document.querySelector(".bm-menu");
+  if (menu) {
+    document.getElementById("react-burger-menu-btn").onclick = () => menu.classList.add("open");
+    document.getElementById("logout_sidebar_link").onclick = (event) => {
+      event.preventDefault();
+      document.cookie = "session-username=; path=/; max-age=0";
+      location.href = "/";
+    };
+  }
+  PAGES[location.pathname]();
+  render();
+}
+
+start();
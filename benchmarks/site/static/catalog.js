@@ -0,0 +1,38 @@
+// Generated catalog for the streaming readers, sized with ?count= (prices ascend with the row index)
+const CATALOG_SIZE = Number(new URLSearchParams(location.search).get("count") || 1000);
+const ROW_HEIGHT = 24;
+const PAGE_SIZE = 50;
+
+const catalogRow = (index) =>
+  `<div class="catalog_item" aria-rowindex="${index}" style="height: ${ROW_HEIGHT}px">` +
+  `<span class="inventory_item_price">$${(index / 4).toFixed(2)}</span></div>`;
+
+function renderVirtualCatalog(list) {
+  const spacer = list.querySelector(".virtual_spacer");
+  spacer.style.height = `${CATALOG_SIZE * ROW_HEIGHT}px`;
+  const render = () => {
+    const first = Math.floor(list.scrollTop / ROW_HEIGHT);
+    const last = Math.min(CATALOG_SIZE, first + Math.ceil(list.clientHeight / ROW_HEIGHT) + 1);
+    const rows = [];
+    for (let index = first; index < last; index++) rows.push(catalogRow(index));
+    spacer.innerHTML = `<div style="transform: translateY(${first * ROW_HEIGHT}px)">${rows.join("")}</div>`;
+  };
+  list.addEventListener("scroll", render);
+  render();
+}
+
+function renderPagedCatalog(list, next) {
+  let page = 0;
+  const render = () => {
+    const rows = [];
+    const end = Math.min(CATALOG_SIZE, (page + 1) * PAGE_SIZE);
+    for (let index = page * PAGE_SIZE; index < end; index++) rows.push(catalogRow(index));
+    list.innerHTML = rows.join("");
+    next.disabled = end >= CATALOG_SIZE;
+  };
+  next.addEventListener("click", () => {
+    page += 1;
+    render();
+  });
+  render();
+}
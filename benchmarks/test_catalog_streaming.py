@@ -0,0 +1,49 @@
+from decimal import Decimal
+import pytest
+from playwright.sync_api import Page
+from pages.base_page import BasePage
+from utils.catalog import assert_sorted, flatten, iter_chunks, iter_paginated_chunks, iter_prices, iter_virtualized_chunks
+
+# Rows of the generated catalogs on the local fixture site
+CATALOG_SIZE = 1000
+PRICE = ".inventory_item_price"
+
+class TestCatalogStreaming:
+    """Streaming reads of large static, virtualized and paginated catalogs"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, page: Page):
+        """Keep the test page"""
+        self.page = page
+
+    def open(self, name: str, count: int = CATALOG_SIZE):
+        """Open a generated catalog page of the local fixture site"""
+        self.page.goto(f"{BasePage.BASE_URL}/{name}.html?count={count}")
+
+    def test_static_chunks(self):
+        """Test that a static list is read in chunks of the requested size"""
+        self.open("catalog-paged")
+
+        chunks = list(iter_chunks(self.page, PRICE, chunk_size=20))
+
+        assert [len(chunk) for chunk in chunks] == [20, 20, 10]
+        assert chunks[0][0] == "$0.00"
+
+    def test_virtualized_chunks(self):
+        """Test that every row of a virtualized list is read once, in order"""
+        self.open("catalog-virtual")
+
+        prices = list(iter_prices(iter_virtualized_chunks(self.page, ".virtual_list", ".catalog_item")))
+
+        assert len(prices) == CATALOG_SIZE
+        assert prices[-1] == Decimal("249.75")
+        assert_sorted(prices, what="Prices")
+
+    def test_paginated_chunks(self):
+        """Test that every page of a paginated list is read until next is disabled"""
+        self.open("catalog-paged", count=120)
+
+        items = list(flatten(iter_paginated_chunks(self.page, PRICE, "#next_page", chunk_size=20)))
+
+        assert len(items) == 120
+        assert items[-1] == "$29.75"
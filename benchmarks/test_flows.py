@@ -0,0 +1,110 @@
+import pytest
+from playwright.sync_api import Page
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from pages.checkout_page import CheckoutPage
+from utils.test_data import (
+    VALID_USERNAME,
+    VALID_PASSWORD,
+    PRODUCT_BACKPACK,
+    PRODUCT_BIKE_LIGHT,
+    PRODUCT_ONESIE,
+    CHECKOUT_INFO
+)
+
+ITEMS = [PRODUCT_BACKPACK, PRODUCT_BIKE_LIGHT, PRODUCT_ONESIE]
+
+class TestFlowRoundTrips:
+    """Compare step-by-step page object flows with their composite actions"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, page: Page, flow_meter):
+        """Initialize page objects and the round trip meter"""
+        self.page = page
+        self.meter = flow_meter
+        self.login_page = LoginPage(page)
+        self.inventory_page = InventoryPage(page)
+        self.checkout_page = CheckoutPage(page)
+
+    def compare(self, name: str, prepare, step_by_step, composite):
+        """Measure both variants of a flow and check the composite one is cheaper"""
+        steps = self.meter.measure(step_by_step, prepare)
+        batched = self.meter.measure(composite, prepare)
+        self.meter.record(name, "step-by-step", *steps)
+        self.meter.record(name, "composite", *batched)
+        assert batched[0] < steps[0], f"{name}: composite action does not save round trips"
+
+    def logged_out(self):
+        """Start from an empty login form"""
+        self.page.context.clear_cookies()
+        self.login_page.navigate()
+
+    def logged_in(self, path: str):
+        """Start from a page of a logged in session with an empty cart"""
+        self.logged_out()
+        self.login_page.quick_login(VALID_USERNAME, VALID_PASSWORD)
+        self.login_page.wait_for_url(f"{self.login_page.base_url}/inventory.html")
+        self.page.evaluate("localStorage.removeItem('cart-contents')")
+        self.login_page.navigate_to(path)
+
+    def test_login(self):
+        """Benchmark login"""
+        def step_by_step():
+            self.login_page.login(VALID_USERNAME, VALID_PASSWORD)
+            self.login_page.wait_for_url(f"{self.login_page.base_url}/inventory.html")
+
+        def composite():
+            self.login_page.quick_login(VALID_USERNAME, VALID_PASSWORD)
+            self.login_page.wait_for_url(f"{self.login_page.base_url}/inventory.html")
+
+        self.compare("login", self.logged_out, step_by_step, composite)
+
+    def test_add_many_to_cart(self):
+        """Benchmark adding several items to cart"""
+        def step_by_step():
+            for item in ITEMS:
+                self.inventory_page.add_item_to_cart(item)
+
+        self.compare(
+            "add-many-to-cart",
+            lambda: self.logged_in("/inventory.html"),
+            step_by_step,
+            lambda: self.inventory_page.add_items_to_cart(ITEMS)
+        )
+
+    def test_fill_and_continue(self):
+        """Benchmark filling checkout information and continuing"""
+        def step_by_step():
+            self.checkout_page.fill_checkout_information(*CHECKOUT_INFO.values())
+            self.checkout_page.click_continue()
+            self.checkout_page.wait_for_url(f"{self.checkout_page.base_url}/checkout-step-two.html")
+
+        def composite():
+            self.checkout_page.fill_and_continue(*CHECKOUT_INFO.values())
+            self.checkout_page.wait_for_url(f"{self.checkout_page.base_url}/checkout-step-two.html")
+
+        self.compare(
+            "fill-and-continue",
+            lambda: self.logged_in("/checkout-step-one.html"),
+            step_by_step,
+            composite
+        )
+
+    def test_full_checkout(self):
+        """Benchmark checkout from step one to the order confirmation"""
+        def step_by_step():
+            self.checkout_page.fill_checkout_information(*CHECKOUT_INFO.values())
+            self.checkout_page.click_continue()
+            self.checkout_page.click_finish()
+            self.checkout_page.wait_for_url(f"{self.checkout_page.base_url}/checkout-complete.html")
+
+        def composite():
+            self.checkout_page.complete_checkout(*CHECKOUT_INFO.values())
+            self.checkout_page.wait_for_url(f"{self.checkout_page.base_url}/checkout-complete.html")
+
+        self.compare(
+            "full-checkout",
+            lambda: self.logged_in("/checkout-step-one.html"),
+            step_by_step,
+            composite
+        )
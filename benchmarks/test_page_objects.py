@@ -0,0 +1,93 @@
+import pytest
+from playwright.sync_api import Page
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from utils.test_data import (
+    VALID_USERNAME,
+    VALID_PASSWORD,
+    PRODUCT_BACKPACK,
+    PRODUCT_BIKE_LIGHT,
+    SORT_PRICE_LOW_HIGH,
+    CHECKOUT_INFO
+)
+
+# Timed rounds per benchmark, after untimed warmup rounds
+ROUNDS = 20
+WARMUP_ROUNDS = 2
+
+class TestPageObjectBenchmarks:
+    """Latency and throughput of the key page object operations on the local fixture site"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, page: Page):
+        """Initialize page objects"""
+        self.page = page
+        self.login_page = LoginPage(page)
+        self.inventory_page = InventoryPage(page)
+        self.cart_page = CartPage(page)
+        self.checkout_page = CheckoutPage(page)
+
+    def run(self, benchmark, operation, setup):
+        """Time operation over several rounds, running the untimed setup before each one"""
+        benchmark.pedantic(operation, setup=setup, rounds=ROUNDS, warmup_rounds=WARMUP_ROUNDS)
+
+    def reload(self):
+        """Reload the current page (setup callables must return None)"""
+        self.page.reload()
+
+    def login(self):
+        """Log in and wait for the inventory page"""
+        self.login_page.navigate()
+        self.login_page.login(VALID_USERNAME, VALID_PASSWORD)
+        self.login_page.wait_for_url(f"{self.login_page.base_url}/inventory.html")
+
+    def test_login(self, benchmark):
+        """Benchmark LoginPage.login"""
+        def setup():
+            self.page.context.clear_cookies()
+            self.login_page.navigate()
+
+        def login():
+            self.login_page.login(VALID_USERNAME, VALID_PASSWORD)
+            self.login_page.wait_for_url(f"{self.login_page.base_url}/inventory.html")
+
+        self.run(benchmark, login, setup)
+
+    def test_sort_and_get_prices(self, benchmark):
+        """Benchmark InventoryPage.sort_products and get_product_prices"""
+        self.login()
+
+        def sort_and_get_prices():
+            self.inventory_page.sort_products(SORT_PRICE_LOW_HIGH)
+            return self.inventory_page.get_product_prices()
+
+        self.run(benchmark, sort_and_get_prices, self.reload)
+
+    def test_get_cart_item_names(self, benchmark):
+        """Benchmark CartPage.get_cart_item_names"""
+        self.login()
+        self.inventory_page.add_item_to_cart(PRODUCT_BACKPACK)
+        self.inventory_page.add_item_to_cart(PRODUCT_BIKE_LIGHT)
+        self.inventory_page.click_cart()
+        self.cart_page.expect_cart_item_count(2)
+
+        self.run(benchmark, self.cart_page.get_cart_item_names, self.reload)
+
+    def test_checkout_to_finish(self, benchmark):
+        """Benchmark CheckoutPage.fill_checkout_information through click_finish"""
+        self.login()
+
+        def setup():
+            self.inventory_page.navigate_to("/inventory.html")
+            self.inventory_page.add_item_to_cart(PRODUCT_BACKPACK)
+            self.checkout_page.navigate_to("/checkout-step-one.html")
+
+        def checkout():
+            self.checkout_page.fill_checkout_information(*CHECKOUT_INFO.values())
+            self.checkout_page.click_continue()
+            self.checkout_page.click_finish()
+            self.checkout_page.wait_for_url(f"{self.checkout_page.base_url}/checkout-complete.html")
+
+        self.run(benchmark, checkout, setup)
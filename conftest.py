@@ -1,4 +1,7 @@
+import json
+import os
 import sys
+import time
 from pathlib import Path
 
 # Add project root to Python path
@@ -6,6 +9,207 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 import pytest
 
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils.har import HAR_MODES, HarSession, HarStore
+from utils.healing import locator_cache
+from utils.page_events import PageEventCollector, PageEventSummary
+from utils.process_stats import process_tree_rss_mb
+from utils.snapshots import SnapshotStore
+from utils.tab_pool import TabPool
+from utils.test_data import VALID_USERNAME, VALID_PASSWORD
+from utils.video import VIDEO_DISK_MB, VIDEO_MODES, VideoRecorder, VideoStats
+
+# Named browser launch profiles.
+# "launch" is merged into browser_type_launch_args, "chromium_args" is only passed
+# to Chromium, and "context" is merged into browser_context_args.
+LAUNCH_PROFILES = {
+    "ci-fast": {
+        # Headless Chromium in Playwright 1.41 runs the lean headless shell
+        "launch": {"headless": True},
+        "chromium_args": [
+            "--disable-gpu",
+            "--disable-extensions",
+            "--disable-component-extensions-with-background-pages",
+            "--disable-background-networking",
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-renderer-backgrounding",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--disable-features=Translate,MediaRouter,OptimizationHints",
+            "--disable-dev-shm-usage",
+            "--mute-audio",
+            "--no-first-run",
+        ],
+        "context": {
+            "viewport": {"width": 800, "height": 600},
+            "reduced_motion": "reduce",
+            "service_workers": "block",
+        },
+    },
+    "debug": {
+        "launch": {"headless": False, "slow_mo": 250},
+        "chromium_args": ["--auto-open-devtools-for-tabs"],
+        "context": {
+            "viewport": {"width": 1280, "height": 720},
+        },
+    },
+    "visual": {
+        "launch": {"headless": True},
+        "chromium_args": ["--force-color-profile=srgb", "--font-render-hinting=none"],
+        "context": {
+            "viewport": {"width": 1920, "height": 1080},
+            "device_scale_factor": 1,
+            "reduced_motion": "reduce",
+            "color_scheme": "light",
+        },
+    },
+}
+
+# HAR store, unpacked and packed once per run by the controller
+HAR_STORE = pytest.StashKey[HarStore]()
+# Archive of the shared read-only context: its login, tab pre-loads and read-only tests
+READONLY_HAR = "readonly-context"
+
+
+# Per worker video recorder, a test's videos, and whether it failed so they are kept
+VIDEO_RECORDER = pytest.StashKey[VideoRecorder]()
+VIDEO_HANDLES = pytest.StashKey[list]()
+VIDEO_FAILED = pytest.StashKey[bool]()
+
+# Measurements for the launch profile benchmark table
+_profile_stats = {"enabled": False, "launch_seconds": None, "test_seconds": [], "peak_rss_mb": None}
+
+# Video counters of all workers, for the terminal summary
+_video_stats = VideoStats()
+# Run wide page event counters, merged from the reports of every test
+_page_event_summary = PageEventSummary()
+
+def pytest_addoption(parser):
+    """
+    Register custom command line options
+    """
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        default=os.environ.get("LAUNCH_PROFILE"),
+        choices=sorted(LAUNCH_PROFILES),
+        help="Named browser launch profile (defaults to $LAUNCH_PROFILE)",
+    )
+    parser.addoption(
+        "--launch-profile-bench",
+        action="store",
+        default=None,
+        help="JSON file collecting launch time, per-test time and RSS per launch profile",
+    )
+    parser.addoption(
+        "--har-mode",
+        action="store",
+        default="off",
+        choices=HAR_MODES,
+        help="Record network traffic to HAR archives or replay tests from them",
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default="hars",
+        help="Directory of the shared HAR store (packed to <dir>.zip after recording)",
+    )
+    parser.addoption(
+        "--autoscale",
+        action="store_true",
+        default=False,
+        help="Adapt the number of pytest-xdist workers to measured browser memory and CPU",
+    )
+    parser.addoption(
+        "--autoscale-warmup",
+        action="store",
+        type=int,
+        default=4,
+        help="Number of tests measured before the worker count is calibrated",
+    )
+    parser.addoption(
+        "--autoscale-interval",
+        action="store",
+        type=int,
+        default=10,
+        help="Number of tests between worker count adjustments",
+    )
+    parser.addoption(
+        "--page-errors",
+        action="store",
+        default="report",
+        choices=["off", "report", "fail"],
+        help="Report console/page/network errors per page, or also fail tests on new ones",
+    )
+    parser.addoption(
+        "--page-errors-baseline",
+        action="store",
+        default=None,
+        help="JSON file of known error signatures, written from this run if it does not exist",
+    )
+    parser.addoption(
+        "--max-new-page-errors",
+        action="store",
+        type=int,
+        default=0,
+        help="Number of errors not in the baseline a test may raise with --page-errors=fail "
+             "(which needs an existing baseline)",
+    )
+    parser.addoption(
+        "--readonly-tabs",
+        action="store",
+        type=int,
+        default=4,
+        help="Number of pre-loaded tabs shared by read-only tests",
+    )
+    parser.addoption(
+        "--locator-cache",
+        action="store",
+        default=".locator-cache.json",
+        help="File of healed locator selectors, reused by later runs",
+    )
+    parser.addoption(
+        "--record-video",
+        action="store",
+        default="off",
+        choices=VIDEO_MODES,
+        help="Record browser tests and keep transcoded videos of failing ones",
+    )
+    parser.addoption(
+        "--video-dir",
+        action="store",
+        default="videos",
+        help="Directory for videos of failing tests",
+    )
+    parser.addoption(
+        "--video-disk-mb",
+        action="store",
+        type=float,
+        default=VIDEO_DISK_MB,
+        help="Disk usage cap of the video directory, the oldest videos are dropped past it",
+    )
+    parser.addoption(
+        "--coordinator",
+        action="store",
+        default=None,
+        help="Serve the collected tests to agents on host:port or unix:/path instead of running them",
+    )
+    parser.addoption(
+        "--agent",
+        action="store",
+        default=None,
+        help="Run the tests handed out by the coordinator at host:port or unix:/path",
+    )
+    parser.addoption(
+        "--local-agents",
+        action="store",
+        type=int,
+        default=0,
+        help="Number of agents the coordinator starts on this host",
+    )
+
 def pytest_configure(config):
     """
     Configure pytest with custom markers
@@ -19,6 +223,326 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow running"
     )
+    config.addinivalue_line(
+        "markers", "har(name): share one HAR archive across the tests of a page object flow"
+    )
+
+    baseline_path = config.getoption("--page-errors-baseline")
+    baseline = None
+    if baseline_path and Path(baseline_path).exists():
+        baseline = set(json.loads(Path(baseline_path).read_text()))
+    if config.getoption("--page-errors") == "fail" and baseline is None:
+        raise pytest.UsageError(
+            "--page-errors fail needs an existing --page-errors-baseline file, "
+            "seed it with a --page-errors report run first"
+        )
+    _page_event_summary.baseline = baseline
+    PageEventCollector.enabled = config.getoption("--page-errors") != "off"
+
+    config.stash[HAR_STORE] = HarStore(config.getoption("--har-dir"))
+    if config.getoption("--har-mode") != "off" and not hasattr(config, "workerinput"):
+        config.stash[HAR_STORE].unpack()
+
+    locator_cache.load(config.getoption("--locator-cache"))
+
+    _profile_stats["enabled"] = bool(
+        config.getoption("--launch-profile") or config.getoption("--launch-profile-bench")
+    )
+
+    if config.getoption("--record-video") != "off":
+        config.stash[VIDEO_RECORDER] = VideoRecorder(
+            config.getoption("--video-dir"), config.getoption("--video-disk-mb")
+        )
+
+    if config.getoption("--autoscale"):
+        from utils.autoscale import WorkerSampler, XdistAutoscale
+        if hasattr(config, "workerinput"):
+            config.pluginmanager.register(WorkerSampler(), "autoscale-sampler")
+        elif config.getoption("numprocesses", None):
+            config.pluginmanager.register(XdistAutoscale(config), "autoscale")
+
+    if config.getoption("--coordinator") or config.getoption("--agent"):
+        from utils.distributed import Agent, Coordinator
+        if config.getoption("--coordinator"):
+            config.pluginmanager.register(
+                Coordinator(config, config.getoption("--coordinator"), config.getoption("--local-agents")),
+                "coordinator",
+            )
+        else:
+            config.pluginmanager.register(Agent(config, config.getoption("--agent")), "agent")
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Turn on recording for the per-test browser contexts when --record-video is set
+    """
+    recorder = config.stash.get(VIDEO_RECORDER, None)
+    if recorder is None:
+        return
+    for item in items:
+        if "page" not in getattr(item, "fixturenames", ()):
+            continue
+        # pytest-playwright applies the closest browser_context_args marker to the context
+        marker = item.get_closest_marker("browser_context_args")
+        kwargs = {**(marker.kwargs if marker else {}), **recorder.context_args()}
+        item.add_marker(pytest.mark.browser_context_args(**kwargs), append=False)
+
+def pytest_sessionfinish(session):
+    """
+    Merge and pack recorded HAR archives, seed the page error baseline, and finish queued
+    video encodes before the summary is printed
+    """
+    store = session.config.stash[HAR_STORE]
+    recorded = session.config.getoption("--har-mode") != "off" and store.root.is_dir()
+    if recorded and not hasattr(session.config, "workerinput"):
+        store.merge_parts()
+        store.pack()
+
+    # Seed the baseline once, from the signatures every worker reported
+    baseline_path = session.config.getoption("--page-errors-baseline")
+    controller = not hasattr(session.config, "workerinput") and not session.config.getoption("--agent")
+    collected = session.config.getoption("--page-errors") != "off"
+    if baseline_path and collected and controller and _page_event_summary.baseline is None:
+        Path(baseline_path).write_text(json.dumps(sorted(_page_event_summary.signatures), indent=2))
+
+    recorder = session.config.stash.get(VIDEO_RECORDER, None)
+    if recorder is not None:
+        recorder.shutdown()
+        _video_stats.merge(recorder.stats.drain())
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """
+    Size the worker pool to the host when -n auto is combined with --autoscale
+    """
+    if config.getoption("--autoscale"):
+        from utils.autoscale import worker_ceiling
+        return worker_ceiling()
+    return None
+
+@pytest.fixture(scope="session")
+def launch_profile(pytestconfig):
+    """
+    Get the selected launch profile settings (empty when no profile is selected)
+    """
+    name = pytestconfig.getoption("--launch-profile")
+    return LAUNCH_PROFILES.get(name, {})
+
+@pytest.fixture(scope="session")
+def browser_type_launch_args(browser_type_launch_args, launch_profile, browser_name):
+    """
+    Apply the launch profile on top of the pytest-playwright launch options
+    """
+    launch_args = {**browser_type_launch_args, **launch_profile.get("launch", {})}
+    if browser_name == "chromium" and launch_profile.get("chromium_args"):
+        launch_args["args"] = launch_args.get("args", []) + launch_profile["chromium_args"]
+    # An explicit --headed always wins over the profile
+    if browser_type_launch_args.get("headless") is False:
+        launch_args["headless"] = False
+    return launch_args
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, launch_profile):
+    """
+    Apply the launch profile on top of the pytest-playwright context options
+    """
+    return {**browser_context_args, **launch_profile.get("context", {})}
+
+@pytest.fixture(scope="session")
+def launch_browser(launch_browser):
+    """
+    Time browser launches for the launch profile benchmark table
+    """
+    def launch(**kwargs):
+        start = time.perf_counter()
+        browser = launch_browser(**kwargs)
+        _profile_stats["launch_seconds"] = time.perf_counter() - start
+        return browser
+
+    return launch
+
+@pytest.fixture(scope="session")
+def har_store(pytestconfig):
+    """
+    Shared HAR store, dropping the archives that missed requests when the worker is done
+    """
+    store = pytestconfig.stash[HAR_STORE]
+    yield store
+    store.discard_stale()
+
+def _worker_id():
+    """
+    Name of this xdist worker ("main" without xdist), to keep per-worker HAR parts apart
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+def _browser_page(request):
+    """
+    Name of the page fixture a browser test uses: its own "page", a pooled "readonly_page", or None
+    """
+    for name in ("page", "readonly_page"):
+        if name in request.fixturenames:
+            return name
+    return None
+
+@pytest.fixture(autouse=True)
+def har_archive(request, pytestconfig, har_store):
+    """
+    Route browser tests through their HAR archive when --har-mode is set
+    """
+    mode = pytestconfig.getoption("--har-mode")
+    fixture = _browser_page(request)
+    if mode == "off" or fixture is None:
+        yield None
+        return
+
+    if fixture == "readonly_page":
+        # Routed with the whole shared context, see readonly_context
+        yield None
+        return
+
+    marker = request.node.get_closest_marker("har")
+    name = marker.args[0] if marker else request.node.nodeid
+    session = HarSession(har_store, name, request.node.nodeid, mode)
+    session.attach(request.getfixturevalue("context"))
+    yield session
+    session.finish()
+
+@pytest.fixture(autouse=True)
+def page_events(request, pytestconfig):
+    """
+    Collect page errors of browser tests and fail on new ones with --page-errors=fail
+    """
+    mode = pytestconfig.getoption("--page-errors")
+    fixture = _browser_page(request)
+    if mode == "off" or fixture is None:
+        yield None
+        return
+
+    collector = PageEventCollector.attach(request.getfixturevalue(fixture))
+    # A pooled read-only tab keeps its collector from test to test
+    collector.reset()
+    yield
+    # Shipped with the teardown report and merged into the run summary on the controller
+    request.node.user_properties.append(("page_events", collector.to_dict()))
+
+    if mode == "fail":
+        new_errors = sorted(collector.signatures - _page_event_summary.baseline)
+        if len(new_errors) > pytestconfig.getoption("--max-new-page-errors"):
+            pytest.fail("New page errors:\n" + "\n".join(new_errors), pytrace=False)
+
+@pytest.fixture(autouse=True)
+def video_recording(request, pytestconfig):
+    """
+    Capture the videos of a browser test's pages, finalised in pytest_runtest_teardown
+    """
+    recorder = pytestconfig.stash.get(VIDEO_RECORDER, None)
+    fixture = _browser_page(request)
+    if recorder is None or fixture is None:
+        yield None
+        return
+
+    if fixture == "page":
+        context = request.getfixturevalue("page").context
+        videos = request.node.stash[VIDEO_HANDLES] = [page.video for page in context.pages if page.video]
+        # Pages opened by the test (popups, new tabs) record too
+        context.on("page", lambda page: page.video and videos.append(page.video))
+        yield videos
+        return
+
+    # The video of a pooled read-only tab spans every test that used it. It is left
+    # running while tests pass; a failing test's tab is closed when released, which
+    # ends its video there, and the video is kept (trimmed to its last seconds).
+    page = request.getfixturevalue("readonly_page")
+    videos = request.node.stash[VIDEO_HANDLES] = []
+    yield videos
+    if request.node.stash.get(VIDEO_FAILED, False) and page.video:
+        request.getfixturevalue("readonly_tabs").retire(page)
+        videos.append(page.video)
+
+@pytest.fixture(scope="session")
+def readonly_context(pytestconfig, browser, browser_context_args, har_store):
+    """
+    One logged-in context shared by all read-only tests of the session
+    """
+    recorder = pytestconfig.stash.get(VIDEO_RECORDER, None)
+    context_args = {**browser_context_args, **(recorder.context_args() if recorder else {})}
+    context = browser.new_context(**context_args)
+    # The login, the tab pool's pre-loads and every read-only test share one archive
+    har_session = None
+    if pytestconfig.getoption("--har-mode") != "off":
+        har_session = HarSession(har_store, READONLY_HAR, _worker_id(), pytestconfig.getoption("--har-mode"))
+        har_session.attach(context)
+    page = context.new_page()
+    login_page = LoginPage(page)
+    login_page.navigate()
+    login_page.login(VALID_USERNAME, VALID_PASSWORD)
+    login_page.wait_for_url(f"{login_page.base_url}/inventory.html")
+    page.close()
+    yield context
+    if har_session is not None:
+        har_session.finish()
+    # Also writes the recorded archive part, merged at the end of the session
+    context.close()
+
+@pytest.fixture(scope="session")
+def readonly_tabs(pytestconfig, readonly_context):
+    """
+    Pool of pre-loaded inventory tabs in the shared read-only context
+    """
+    pool = TabPool(
+        readonly_context,
+        f"{BasePage.BASE_URL}/inventory.html",
+        size=pytestconfig.getoption("--readonly-tabs"),
+    )
+    yield pool
+    pool.close()
+
+@pytest.fixture
+def readonly_page(readonly_tabs, readonly_context):
+    """
+    A tab of the shared logged-in context, failing the test if it changes app state
+    """
+    page = readonly_tabs.acquire()
+    state = readonly_context.storage_state()
+    yield page
+    if readonly_context.storage_state() != state:
+        readonly_tabs.restore(page, state)
+        readonly_tabs.discard(page)
+        pytest.fail("Read-only test changed cookies or localStorage of the shared context", pytrace=False)
+    readonly_tabs.release(page)
+
+@pytest.fixture(scope="session")
+def snapshot_store(pytestconfig, browser, browser_context_args, har_store):
+    """
+    Per worker cache of named app state snapshots, built through the HAR store
+    """
+    return SnapshotStore(
+        browser, browser_context_args,
+        har_store=har_store, har_mode=pytestconfig.getoption("--har-mode"), worker=_worker_id()
+    )
+
+@pytest.fixture
+def restore_snapshot(page, snapshot_store):
+    """
+    Restore the test page to a named app state snapshot in one call
+    """
+    def restore(name: str):
+        snapshot_store.restore(page, name)
+        return page
+
+    return restore
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    """
+    Delete the videos of a passing browser test and queue a failing one's for transcoding,
+    once pytest-playwright has closed the context and the videos are saved
+    """
+    yield
+    recorder = item.config.stash.get(VIDEO_RECORDER, None)
+    videos = item.stash.get(VIDEO_HANDLES, None)
+    if recorder is not None and videos is not None:
+        recorder.collect(videos, item.nodeid, item.stash.get(VIDEO_FAILED, False))
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -27,7 +551,26 @@ def pytest_runtest_makereport(item, call):
     """
     outcome = yield
     report = outcome.get_result()
-    
+
+    heals = locator_cache.drain()
+    if heals:
+        report.user_properties.append(("healed_locators", heals))
+
+    # Keep the video of a test that failed in setup or call
+    if report.failed and report.when in ("setup", "call"):
+        item.stash[VIDEO_FAILED] = True
+    recorder = item.config.stash.get(VIDEO_RECORDER, None)
+    if recorder is not None and report.when == "teardown":
+        counters = recorder.stats.drain()
+        if counters:
+            report.user_properties.append(("video", counters))
+
+    # Measured where the test ran, so an xdist controller does not scan every worker
+    if _profile_stats["enabled"] and report.when == "call":
+        rss = process_tree_rss_mb()
+        if rss is not None:
+            report.user_properties.append(("profile_rss_mb", rss))
+
     if report.when == "call" and report.failed:
         # Get the page fixture if it exists
         page = item.funcargs.get("page")
@@ -38,4 +581,130 @@ def pytest_runtest_makereport(item, call):
                 page.screenshot(path=screenshot_path)
                 print(f"\nScreenshot saved: {screenshot_path}")
             except:
-                pass  # Ignore if screenshot fails
\ No newline at end of file
+                pass  # Ignore if screenshot fails
+
+def pytest_runtest_logreport(report):
+    """
+    Merge the counters shipped with each report, and record per-test time and browser memory
+    for the launch profile benchmark table
+    """
+    for name, value in report.user_properties:
+        if name == "healed_locators":
+            locator_cache.merge(value)
+        elif name == "page_events":
+            _page_event_summary.add(report.nodeid, value)
+        elif name == "video":
+            _video_stats.merge(value)
+        elif name == "profile_rss_mb":
+            _profile_stats["peak_rss_mb"] = max(value, _profile_stats["peak_rss_mb"] or 0.0)
+    if _profile_stats["enabled"] and report.when == "call":
+        _profile_stats["test_seconds"].append(report.duration)
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Print the page event, launch profile, healed locator and video summaries
+    """
+    _page_events_summary(terminalreporter, config)
+    _launch_profile_summary(terminalreporter, config)
+    _healed_locators_summary(terminalreporter, config)
+    _video_summary(terminalreporter, config)
+
+def _page_events_summary(terminalreporter, config):
+    """
+    Print error counters per page URL and the slowest backend requests
+    """
+    summary = _page_event_summary
+    if not (summary.per_url or summary.slowest):
+        return
+
+    terminalreporter.section("page events")
+    kinds = ["console_error", "page_error", "request_failed", "slow_response"]
+    terminalreporter.write_line(f"{'page':<50} " + " ".join(f"{kind:>14}" for kind in kinds))
+    for url, counter in sorted(summary.per_url.items()):
+        terminalreporter.write_line(f"{url:<50} " + " ".join(f"{counter[kind]:>14}" for kind in kinds))
+    if summary.per_test:
+        terminalreporter.write_line(f"{len(summary.per_test)} test(s) raised page events")
+    if summary.slowest:
+        terminalreporter.write_line("slowest backend requests:")
+        for duration, request in summary.slowest_requests():
+            terminalreporter.write_line(f"{duration:>10.0f} ms  {request}")
+
+def _launch_profile_summary(terminalreporter, config):
+    """
+    Print launch time, per-test time and RSS for each measured launch profile
+    """
+    name = config.getoption("--launch-profile")
+    bench_path = config.getoption("--launch-profile-bench")
+    if not name and not bench_path:
+        return
+
+    test_seconds = _profile_stats["test_seconds"]
+    rows = {}
+    if bench_path and Path(bench_path).exists():
+        rows = json.loads(Path(bench_path).read_text())
+    if test_seconds:
+        rows[name or "default"] = {
+            "launch_seconds": _profile_stats["launch_seconds"],
+            "mean_test_seconds": sum(test_seconds) / len(test_seconds),
+            "peak_rss_mb": _profile_stats["peak_rss_mb"],
+            "tests": len(test_seconds),
+        }
+    if bench_path:
+        Path(bench_path).write_text(json.dumps(rows, indent=2))
+
+    def fmt(value, width, precision):
+        text = "n/a" if value is None else f"{value:.{precision}f}"
+        return text.rjust(width)
+
+    terminalreporter.section("launch profiles")
+    terminalreporter.write_line(
+        f"{'profile':<10} {'launch (s)':>10} {'per test (s)':>12} {'peak RSS (MB)':>14} {'tests':>6}"
+    )
+    for profile, row in sorted(rows.items()):
+        terminalreporter.write_line(
+            f"{profile:<10} {fmt(row['launch_seconds'], 10, 3)} "
+            f"{fmt(row['mean_test_seconds'], 12, 3)} "
+            f"{fmt(row['peak_rss_mb'], 14, 1)} {row['tests']:>6}"
+        )
+
+def _healed_locators_summary(terminalreporter, config):
+    """
+    Print the locators that only matched through a fallback and save the learned selectors
+    """
+    if hasattr(config, "workerinput"):
+        return
+    locator_cache.save()
+    if not locator_cache.report:
+        return
+
+    terminalreporter.section("healed locators")
+    for primary, heal in sorted(locator_cache.report.items(), key=lambda item: item[1]["locator"]):
+        terminalreporter.write_line(f"{heal['locator']}: {primary} -> {heal['healed']}")
+    terminalreporter.write_line(
+        f"{len(locator_cache.report)} locator(s) healed, fix them at the source "
+        f"(cached in {config.getoption('--locator-cache')})"
+    )
+
+def _video_summary(terminalreporter, config):
+    """
+    Print recording overhead per test and transcoding throughput
+    """
+    if config.getoption("--record-video") == "off" or not _video_stats.tests:
+        return
+
+    terminalreporter.section("videos")
+    terminalreporter.write_line(
+        f"{_video_stats.tests} test(s) recorded, {_video_stats.deleted} passing video(s) deleted, "
+        f"{_video_stats.encoded} failing video(s) kept in {config.getoption('--video-dir')}"
+    )
+    terminalreporter.write_line(f"teardown overhead per test: {_video_stats.overhead_ms:.0f} ms")
+    if _video_stats.encoded:
+        terminalreporter.write_line(
+            f"transcoded {_video_stats.encoded_bytes / 1024 / 1024:.1f} MB "
+            f"at {_video_stats.throughput_mb_s:.1f} MB/s"
+        )
+    if _video_stats.dropped:
+        terminalreporter.write_line(
+            f"{_video_stats.dropped} older video(s) dropped by the "
+            f"{config.getoption('--video-disk-mb'):.0f} MB disk cap"
+        )
@@ -1,11 +1,110 @@
-from playwright.sync_api import Page, expect
+import functools
+from playwright.sync_api import Locator, Page, expect
+from utils.healing import locator_cache
+from utils.page_events import PageEventCollector
+
+# Checks shared by the composite action scripts, after Playwright's actionability
+# checks. A selector must match at most one element (querySelectorAll also throws on
+# non-CSS selectors, which fails the wait at once). An element is visible when it
+# has a layout box and is not visibility:hidden, stable when its box did not move
+# since the previous poll, and receives clicks when it is the element hit at its
+# centre once scrolled into view (not covered by an overlay).
+ACTIONABILITY_HELPERS = """
+    const resolve = (selector) => {
+        const matches = document.querySelectorAll(selector);
+        if (matches.length > 1) throw new Error(`${selector} matches ${matches.length} elements`);
+        return matches[0];
+    };
+    const visible = (element) =>
+        element.getClientRects().length > 0 && getComputedStyle(element).visibility === "visible";
+    const stable = (element) => {
+        const rect = element.getBoundingClientRect();
+        const box = [rect.x, rect.y, rect.width, rect.height].join();
+        const previous = element.__actionabilityBox;
+        element.__actionabilityBox = box;
+        return previous === box;
+    };
+    const receivesClick = (element) => {
+        element.scrollIntoView({ block: "center", inline: "center" });
+        const rect = element.getBoundingClientRect();
+        const hit = document.elementFromPoint(rect.x + rect.width / 2, rect.y + rect.height / 2);
+        return hit !== null && (hit === element || element.contains(hit));
+    };
+"""
+
+# Polls in the page until every field is visible and editable, then sets all
+# values at once. The native value setter keeps React controlled inputs in sync.
+FILL_FIELDS_SCRIPT = """
+(fields) => {
+%s
+    const inputs = Object.keys(fields).map(resolve);
+    const ready = inputs.every((input) =>
+        input && visible(input) && !input.disabled && !input.readOnly);
+    if (!ready) return false;
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    inputs.forEach((input, index) => {
+        input.focus();
+        setValue.call(input, Object.values(fields)[index]);
+        input.dispatchEvent(new Event("input", { bubbles: true }));
+        input.dispatchEvent(new Event("change", { bubbles: true }));
+    });
+    return true;
+}
+""" % ACTIONABILITY_HELPERS
+
+# Polls in the page until every button is visible, enabled, stable and not
+# covered, then clicks them in order
+CLICK_ALL_SCRIPT = """
+(selectors) => {
+%s
+    const buttons = selectors.map(resolve);
+    const ready = buttons.every((button) =>
+        button && visible(button) && !button.disabled && receivesClick(button) && stable(button));
+    if (!ready) return false;
+    buttons.forEach((button) => button.click());
+    return true;
+}
+""" % ACTIONABILITY_HELPERS
+
+class ReadOnlyError(Exception):
+    """Raised when a state-changing action is used on a read-only tab"""
+
+def mutating(method):
+    """Mark a page object method as changing app state (cart, session, orders)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.read_only:
+            raise ReadOnlyError(
+                f"{type(self).__name__}.{method.__name__} changes app state and is blocked on a read-only tab"
+            )
+        return method(self, *args, **kwargs)
+    return wrapper
 
 class BasePage:
     """Base page class that all page objects inherit from"""
     
+    BASE_URL = "https://www.saucedemo.com"
+    
+    # Tabs of a shared context where state-changing actions are blocked
+    _read_only_pages = set()
+    
     def __init__(self, page: Page):
         self.page = page
-        self.base_url = "https://www.saucedemo.com"
+        self.base_url = self.BASE_URL
+        self.events = PageEventCollector.attach(page)
+    
+    @classmethod
+    def set_read_only(cls, page: Page, read_only: bool = True):
+        """Block or allow state-changing page object actions on a tab"""
+        if read_only:
+            cls._read_only_pages.add(page)
+        else:
+            cls._read_only_pages.discard(page)
+    
+    @property
+    def read_only(self) -> bool:
+        """Check if state-changing actions are blocked on this page"""
+        return self.page in self._read_only_pages
     
     def navigate_to(self, path: str = ""):
         """Navigate to a specific path"""
@@ -20,21 +119,46 @@ class BasePage:
         """Wait for URL to match"""
         self.page.wait_for_url(url, timeout=timeout)
     
+    def resolve(self, selector: str, wait: bool = True) -> str:
+        """Get the working selector for a locator, healing it through its fallbacks"""
+        return locator_cache.resolve(self.page, selector, wait)
+    
+    def locator(self, selector: str) -> Locator:
+        """Get a locator for a selector without waiting for the element"""
+        return self.page.locator(self.resolve(selector, wait=False))
+    
     def click(self, selector: str):
         """Click an element"""
-        self.page.click(selector)
+        self.page.click(self.resolve(selector))
     
     def fill(self, selector: str, text: str):
         """Fill an input field"""
-        self.page.fill(selector, text)
+        self.page.fill(self.resolve(selector), text)
+    
+    def fill_fields(self, fields: dict, timeout: int = 5000):
+        """
+        Fill several input fields (CSS selector -> text) in a single round trip.
+        Values are set from page script, so the input events are untrusted;
+        use fill() for fields that check isTrusted or need key presses.
+        """
+        self.page.wait_for_function(FILL_FIELDS_SCRIPT, arg=fields, timeout=timeout)
+    
+    def click_all(self, selectors: list, timeout: int = 5000):
+        """
+        Click several buttons (CSS selectors) in order in a single round trip.
+        Clicks are DOM clicks from page script, so the events are untrusted and
+        buttons are resolved once, before the first click; use click() for
+        buttons that check isTrusted or are re-rendered by an earlier click.
+        """
+        self.page.wait_for_function(CLICK_ALL_SCRIPT, arg=selectors, timeout=timeout)
     
     def get_text(self, selector: str) -> str:
         """Get text content of an element"""
-        return self.page.locator(selector).text_content()
+        return self.page.locator(self.resolve(selector)).text_content()
     
     def is_visible(self, selector: str) -> bool:
         """Check if element is visible"""
-        return self.page.locator(selector).is_visible()
+        return self.locator(selector).is_visible()
     
     def expect_url(self, url: str):
         """Assert that current URL matches expected URL"""
@@ -42,8 +166,8 @@ class BasePage:
     
     def expect_visible(self, selector: str):
         """Assert that element is visible"""
-        expect(self.page.locator(selector)).to_be_visible()
+        expect(self.locator(selector)).to_be_visible()
     
     def expect_text(self, selector: str, text: str):
         """Assert that element contains expected text"""
-        expect(self.page.locator(selector)).to_have_text(text)
\ No newline at end of file
+        expect(self.locator(selector)).to_have_text(text)
\ No newline at end of file
@@ -1,14 +1,16 @@
 from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from pages.base_page import BasePage, mutating
+from utils.healing import HealingLocator
 
 class CartPage(BasePage):
     """Page Object for the Shopping Cart page"""
     
     # Locators
-    CART_ITEMS = ".cart_item"
-    CART_ITEM_NAME = ".inventory_item_name"
-    CONTINUE_SHOPPING_BUTTON = "#continue-shopping"
-    CHECKOUT_BUTTON = "#checkout"
+    CART_ITEMS = HealingLocator(".cart_item", data_test="inventory-item")
+    CART_ITEM_NAME = HealingLocator(".inventory_item_name", data_test="inventory-item-name")
+    CONTINUE_SHOPPING_BUTTON = HealingLocator("#continue-shopping", data_test="continue-shopping",
+                                              role="button", name="Continue Shopping")
+    CHECKOUT_BUTTON = HealingLocator("#checkout", data_test="checkout", role="button", name="Checkout")
     
     def __init__(self, page: Page):
         super().__init__(page)
@@ -16,15 +18,16 @@ class CartPage(BasePage):
     
     def get_cart_item_count(self) -> int:
         """Get number of items in cart"""
-        return self.page.locator(self.CART_ITEMS).count()
+        return self.locator(self.CART_ITEMS).count()
     
     def get_cart_item_names(self) -> list:
         """Get all item names in cart"""
-        return self.page.locator(self.CART_ITEM_NAME).all_text_contents()
+        return self.locator(self.CART_ITEM_NAME).all_text_contents()
     
+    @mutating
     def remove_item(self, item_name: str):
         """Remove item from cart by name"""
-        button_id = f"#remove-{item_name}"
+        button_id = HealingLocator(f"#remove-{item_name}", data_test=f"remove-{item_name}")
         self.click(button_id)
     
     def continue_shopping(self):
@@ -37,7 +40,7 @@ class CartPage(BasePage):
     
     def expect_cart_item_count(self, count: int):
         """Assert expected number of items in cart"""
-        expect(self.page.locator(self.CART_ITEMS)).to_have_count(count)
+        expect(self.locator(self.CART_ITEMS)).to_have_count(count)
     
     def expect_on_cart_page(self):
         """Assert user is on cart page"""
@@ -1,26 +1,29 @@
 from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from pages.base_page import BasePage, mutating
+from utils.healing import HealingLocator
 
 class CheckoutPage(BasePage):
     """Page Object for the Checkout pages (step one, step two, and complete)"""
     
     # Step One Locators
-    FIRST_NAME_INPUT = "#first-name"
-    LAST_NAME_INPUT = "#last-name"
-    POSTAL_CODE_INPUT = "#postal-code"
-    CONTINUE_BUTTON = "#continue"
-    CANCEL_BUTTON = "#cancel"
-    ERROR_MESSAGE = "[data-test='error']"
+    FIRST_NAME_INPUT = HealingLocator("#first-name", data_test="firstName", role="textbox", name="First Name")
+    LAST_NAME_INPUT = HealingLocator("#last-name", data_test="lastName", role="textbox", name="Last Name")
+    POSTAL_CODE_INPUT = HealingLocator("#postal-code", data_test="postalCode", role="textbox", name="Zip/Postal Code")
+    CONTINUE_BUTTON = HealingLocator("#continue", data_test="continue", role="button", name="Continue")
+    CANCEL_BUTTON = HealingLocator("#cancel", data_test="cancel", role="button", name="Cancel")
+    ERROR_MESSAGE = HealingLocator("[data-test='error']", alternatives=(".error-message-container h3",))
     
     # Step Two Locators
-    CART_ITEMS = ".cart_item"
-    SUMMARY_INFO = ".summary_info"
-    SUMMARY_TOTAL = ".summary_total_label"
-    FINISH_BUTTON = "#finish"
+    CART_ITEMS = HealingLocator(".cart_item", data_test="inventory-item")
+    SUMMARY_INFO = HealingLocator(".summary_info", alternatives=(".checkout_summary_container",))
+    SUMMARY_TOTAL = HealingLocator(".summary_total_label", data_test="total-label")
+    FINISH_BUTTON = HealingLocator("#finish", data_test="finish", role="button", name="Finish")
     
     # Complete Page Locators
-    COMPLETE_HEADER = ".complete-header"
-    BACK_TO_PRODUCTS_BUTTON = "#back-to-products"
+    COMPLETE_HEADER = HealingLocator(".complete-header", data_test="complete-header",
+                                     text="Thank you for your order!")
+    BACK_TO_PRODUCTS_BUTTON = HealingLocator("#back-to-products", data_test="back-to-products",
+                                             role="button", name="Back Home")
     
     def __init__(self, page: Page):
         super().__init__(page)
@@ -45,6 +48,15 @@ class CheckoutPage(BasePage):
         self.enter_last_name(last_name)
         self.enter_postal_code(postal_code)
     
+    def fill_and_continue(self, first_name: str, last_name: str, postal_code: str):
+        """Fill all checkout information fields in one round trip and continue"""
+        self.fill_fields({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.POSTAL_CODE_INPUT: postal_code
+        })
+        self.click_continue()
+    
     def click_continue(self):
         """Click continue button"""
         self.click(self.CONTINUE_BUTTON)
@@ -59,17 +71,24 @@ class CheckoutPage(BasePage):
     
     def expect_error_message(self, message: str):
         """Assert error message contains expected text"""
-        expect(self.page.locator(self.ERROR_MESSAGE)).to_contain_text(message)
+        expect(self.locator(self.ERROR_MESSAGE)).to_contain_text(message)
     
     # Step Two Methods
     def get_overview_item_count(self) -> int:
         """Get number of items in checkout overview"""
-        return self.page.locator(self.CART_ITEMS).count()
+        return self.locator(self.CART_ITEMS).count()
     
+    @mutating
     def click_finish(self):
         """Click finish button"""
         self.click(self.FINISH_BUTTON)
     
+    @mutating
+    def complete_checkout(self, first_name: str, last_name: str, postal_code: str):
+        """Complete checkout from step one through to the order confirmation"""
+        self.fill_and_continue(first_name, last_name, postal_code)
+        self.click_finish()
+    
     def expect_on_overview_page(self):
         """Assert user is on checkout overview page"""
         self.expect_url(f"{self.base_url}/checkout-step-two.html")
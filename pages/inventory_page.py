@@ -1,19 +1,21 @@
 from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from pages.base_page import BasePage, mutating
+from utils.healing import HealingLocator
+from utils.catalog import DEFAULT_CHUNK_SIZE, PRICE_FORMATS, flatten, iter_chunks, iter_prices
 
 class InventoryPage(BasePage):
     """Page Object for the Inventory/Products page"""
     
     # Locators
-    TITLE = ".title"
-    INVENTORY_ITEMS = ".inventory_item"
-    INVENTORY_ITEM_NAME = ".inventory_item_name"
-    INVENTORY_ITEM_PRICE = ".inventory_item_price"
-    SHOPPING_CART_LINK = ".shopping_cart_link"
-    SHOPPING_CART_BADGE = ".shopping_cart_badge"
-    SORT_DROPDOWN = ".product_sort_container"
-    BURGER_MENU = "#react-burger-menu-btn"
-    LOGOUT_LINK = "#logout_sidebar_link"
+    TITLE = HealingLocator(".title", data_test="title", text="Products")
+    INVENTORY_ITEMS = HealingLocator(".inventory_item", data_test="inventory-item")
+    INVENTORY_ITEM_NAME = HealingLocator(".inventory_item_name", data_test="inventory-item-name")
+    INVENTORY_ITEM_PRICE = HealingLocator(".inventory_item_price", data_test="inventory-item-price")
+    SHOPPING_CART_LINK = HealingLocator(".shopping_cart_link", data_test="shopping-cart-link")
+    SHOPPING_CART_BADGE = HealingLocator(".shopping_cart_badge", data_test="shopping-cart-badge")
+    SORT_DROPDOWN = HealingLocator(".product_sort_container", data_test="product-sort-container", role="combobox")
+    BURGER_MENU = HealingLocator("#react-burger-menu-btn", role="button", name="Open Menu")
+    LOGOUT_LINK = HealingLocator("#logout_sidebar_link", data_test="logout-sidebar-link", role="link", name="Logout")
     
     def __init__(self, page: Page):
         super().__init__(page)
@@ -25,16 +27,23 @@ class InventoryPage(BasePage):
     
     def get_product_count(self) -> int:
         """Get number of products displayed"""
-        return self.page.locator(self.INVENTORY_ITEMS).count()
+        return self.locator(self.INVENTORY_ITEMS).count()
     
+    @mutating
     def add_item_to_cart(self, item_name: str):
         """Add item to cart by item name (e.g., 'sauce-labs-backpack')"""
-        button_id = f"#add-to-cart-{item_name}"
+        button_id = HealingLocator(f"#add-to-cart-{item_name}", data_test=f"add-to-cart-{item_name}")
         self.click(button_id)
     
+    @mutating
+    def add_items_to_cart(self, item_names: list):
+        """Add several items to cart in one round trip"""
+        self.click_all([f"#add-to-cart-{item_name}" for item_name in item_names])
+    
+    @mutating
     def remove_item_from_cart(self, item_name: str):
         """Remove item from cart by item name"""
-        button_id = f"#remove-{item_name}"
+        button_id = HealingLocator(f"#remove-{item_name}", data_test=f"remove-{item_name}")
         self.click(button_id)
     
     def get_cart_item_count(self) -> str:
@@ -49,26 +58,41 @@ class InventoryPage(BasePage):
     
     def sort_products(self, sort_option: str):
         """Sort products by option (az, za, lohi, hilo)"""
-        self.page.select_option(self.SORT_DROPDOWN, sort_option)
+        self.page.select_option(self.resolve(self.SORT_DROPDOWN), sort_option)
     
     def get_product_names(self) -> list:
         """Get all product names"""
-        return self.page.locator(self.INVENTORY_ITEM_NAME).all_text_contents()
+        return self.locator(self.INVENTORY_ITEM_NAME).all_text_contents()
     
     def get_product_prices(self) -> list:
-        """Get all product prices as float values"""
-        prices = self.page.locator(self.INVENTORY_ITEM_PRICE).all_text_contents()
-        return [float(price.replace("$", "")) for price in prices]
+        """Get all product prices as exact Decimal values"""
+        prices = self.locator(self.INVENTORY_ITEM_PRICE).all_text_contents()
+        return PRICE_FORMATS["en_US"].parse_many(prices)
+    
+    def iter_product_names(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Stream product names in chunks, for catalogs too large to pull at once"""
+        return flatten(iter_chunks(self.page, self._wait_for_list(self.INVENTORY_ITEM_NAME), chunk_size))
+    
+    def iter_product_prices(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Stream product prices as exact Decimal values in chunks"""
+        return iter_prices(iter_chunks(self.page, self._wait_for_list(self.INVENTORY_ITEM_PRICE), chunk_size))
+    
+    def _wait_for_list(self, selector: str) -> str:
+        """Resolve a list item locator (healing it if needed) and wait for the first item to render"""
+        resolved = self.resolve(selector)
+        self.page.locator(resolved).first.wait_for()
+        return resolved
     
     def click_product(self, item_id: str):
         """Click on a product to view details"""
-        product_link = f"#item_{item_id}_title_link"
+        product_link = HealingLocator(f"#item_{item_id}_title_link", data_test=f"item-{item_id}-title-link")
         self.click(product_link)
     
     def open_menu(self):
         """Open burger menu"""
         self.click(self.BURGER_MENU)
     
+    @mutating
     def logout(self):
         """Logout from application"""
         self.open_menu()
@@ -76,12 +100,12 @@ class InventoryPage(BasePage):
     
     def expect_cart_badge_count(self, count: str):
         """Assert cart badge shows expected count"""
-        expect(self.page.locator(self.SHOPPING_CART_BADGE)).to_have_text(count)
+        expect(self.locator(self.SHOPPING_CART_BADGE)).to_have_text(count)
     
     def expect_cart_badge_not_visible(self):
         """Assert cart badge is not visible"""
-        expect(self.page.locator(self.SHOPPING_CART_BADGE)).not_to_be_visible()
+        expect(self.locator(self.SHOPPING_CART_BADGE)).not_to_be_visible()
     
     def expect_product_count(self, count: int):
         """Assert expected number of products"""
-        expect(self.page.locator(self.INVENTORY_ITEMS)).to_have_count(count)
\ No newline at end of file
+        expect(self.locator(self.INVENTORY_ITEMS)).to_have_count(count)
\ No newline at end of file
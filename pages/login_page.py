@@ -1,14 +1,15 @@
 from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from pages.base_page import BasePage, mutating
+from utils.healing import HealingLocator
 
 class LoginPage(BasePage):
     """Page Object for the Login page"""
     
     # Locators
-    USERNAME_INPUT = "#user-name"
-    PASSWORD_INPUT = "#password"
-    LOGIN_BUTTON = "#login-button"
-    ERROR_MESSAGE = "[data-test='error']"
+    USERNAME_INPUT = HealingLocator("#user-name", data_test="username", role="textbox", name="Username")
+    PASSWORD_INPUT = HealingLocator("#password", data_test="password", role="textbox", name="Password")
+    LOGIN_BUTTON = HealingLocator("#login-button", data_test="login-button", role="button", name="Login")
+    ERROR_MESSAGE = HealingLocator("[data-test='error']", alternatives=(".error-message-container h3",))
     
     def __init__(self, page: Page):
         super().__init__(page)
@@ -26,16 +27,24 @@ class LoginPage(BasePage):
         """Enter password"""
         self.fill(self.PASSWORD_INPUT, password)
     
+    @mutating
     def click_login(self):
         """Click login button"""
         self.click(self.LOGIN_BUTTON)
     
+    @mutating
     def login(self, username: str, password: str):
         """Perform complete login action"""
         self.enter_username(username)
         self.enter_password(password)
         self.click_login()
     
+    @mutating
+    def quick_login(self, username: str, password: str):
+        """Perform login with both fields filled in one round trip"""
+        self.fill_fields({self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password})
+        self.click_login()
+    
     def get_error_message(self) -> str:
         """Get error message text"""
         return self.get_text(self.ERROR_MESSAGE)
@@ -46,7 +55,7 @@ class LoginPage(BasePage):
     
     def expect_error_message(self, message: str):
         """Assert error message contains expected text"""
-        expect(self.page.locator(self.ERROR_MESSAGE)).to_contain_text(message)
+        expect(self.locator(self.ERROR_MESSAGE)).to_contain_text(message)
     
     def expect_login_successful(self):
         """Assert that login was successful"""
@@ -0,0 +1,163 @@
+import pytest
+from utils.autoscale import WorkerAutoscaler, AutoscaleScheduling
+
+class FakeGateway:
+    def __init__(self, id):
+        self.id = id
+
+class FakeNode:
+    """Stand-in for an xdist WorkerController"""
+
+    def __init__(self, id):
+        self.gateway = FakeGateway(id)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+class FakeConfig:
+    """Stand-in for the controller config of a three worker run"""
+
+    def getvalue(self, name):
+        return ["3*popen"] if name == "tx" else None
+
+    def getoption(self, name):
+        return None
+
+class TestWorkerAutoscaler:
+    """Test cases for the worker count decisions"""
+
+    def make_autoscaler(self, **kwargs):
+        options = dict(max_workers=8, cpu_count=8, memory_reserve_mb=1000, warmup_tests=2, interval=5)
+        options.update(kwargs)
+        return WorkerAutoscaler(**options)
+
+    def test_starts_with_probe_workers(self):
+        """Test that only the probe workers run before calibration"""
+        assert self.make_autoscaler().target == 2
+        assert self.make_autoscaler(max_workers=1).target == 1
+
+    def test_waits_for_warmup_samples(self):
+        """Test that no decision is taken before the warmup samples are in"""
+        autoscaler = self.make_autoscaler()
+        autoscaler.record(500, 1.0)
+
+        assert autoscaler.decide(1, available_mb=16000, load=0.0) is None
+        assert autoscaler.target == 2
+
+    def test_calibrates_to_memory_limit(self):
+        """Test that calibration fits the pool in available memory"""
+        autoscaler = self.make_autoscaler()
+        autoscaler.record(1000, 0.5)
+        autoscaler.record(1000, 0.5)
+
+        assert autoscaler.decide(2, available_mb=3000, load=0.0)
+        # 3000 MB free + 2 running workers - 1000 MB reserve = 4 workers
+        assert autoscaler.target == 4
+
+    def test_calibrates_to_cpu_limit(self):
+        """Test that calibration fits the pool in the CPU cores"""
+        autoscaler = self.make_autoscaler()
+        autoscaler.record(100, 2.0)
+        autoscaler.record(100, 2.0)
+
+        autoscaler.decide(2, available_mb=64000, load=0.0)
+        assert autoscaler.target == 4
+
+    def test_throttles_under_memory_pressure(self):
+        """Test that a worker is removed when memory runs low"""
+        autoscaler = self.make_autoscaler()
+        autoscaler.record(100, 0.5)
+        autoscaler.record(100, 0.5)
+        autoscaler.decide(2, available_mb=64000, load=0.0)
+        assert autoscaler.target == 8
+
+        assert "memory pressure" in autoscaler.decide(7, available_mb=500, load=0.0)
+        assert autoscaler.target == 7
+
+    def test_capacity_counts_parked_workers(self):
+        """Test that memory still held by parked workers counts towards the capacity"""
+        autoscaler = self.make_autoscaler()
+        autoscaler.record(1000, 0.5)
+        autoscaler.record(1000, 0.5)
+
+        # 2000 MB free + 2 running workers + 1000 MB parked - 1000 MB reserve = 4 workers
+        assert autoscaler.capacity(available_mb=2000, parked_mb=1000) == 4
+        assert autoscaler.capacity(available_mb=2000) == 3
+
+    def test_adds_worker_with_headroom(self):
+        """Test that a worker is added back when the host has headroom"""
+        autoscaler = self.make_autoscaler()
+        autoscaler.record(1000, 0.5)
+        autoscaler.record(1000, 0.5)
+        autoscaler.decide(2, available_mb=3000, load=0.0)
+
+        assert autoscaler.decide(4, available_mb=9000, load=1.0) is None
+        assert "headroom" in autoscaler.decide(7, available_mb=9000, load=1.0)
+        assert autoscaler.target == 5
+
+class TestAutoscaleScheduling:
+    """Test cases for the pull based scheduler"""
+
+    @pytest.fixture
+    def scheduler(self):
+        scheduler = AutoscaleScheduling(FakeConfig(), target=1)
+        self.nodes = [FakeNode(f"gw{index}") for index in range(3)]
+        for node in self.nodes:
+            scheduler.add_node(node)
+            scheduler.add_node_collection(node, [f"test_{index}" for index in range(10)])
+        scheduler.schedule()
+        return scheduler
+
+    def test_only_active_workers_pull_tests(self, scheduler):
+        """Test that parked workers get no tests"""
+        assert self.nodes[0].sent == [0, 1]
+        assert self.nodes[1].sent == []
+        assert self.nodes[2].sent == []
+
+    def test_raising_target_feeds_parked_workers(self, scheduler):
+        """Test that a higher target starts feeding parked workers"""
+        scheduler.set_target(3)
+
+        assert self.nodes[1].sent == [2, 3]
+        assert self.nodes[2].sent == [4, 5]
+
+    def test_finished_test_pulls_next_one(self, scheduler):
+        """Test that a worker pulls one test from the queue per finished test"""
+        scheduler.mark_test_complete(self.nodes[0], 0)
+
+        assert self.nodes[0].sent == [0, 1, 2]
+
+    def test_empty_queue_shuts_down_all_workers(self, scheduler):
+        """Test that every worker is shut down once the queue is drained"""
+        for index in range(10):
+            scheduler.mark_test_complete(self.nodes[0], index)
+
+        assert all(node.shutting_down for node in self.nodes)
+        assert scheduler.tests_finished
+
+    def test_lower_target_shuts_down_used_workers(self, scheduler):
+        """Test that a worker that ran tests is shut down rather than parked holding a test"""
+        scheduler.set_target(2)
+        scheduler.mark_test_complete(self.nodes[0], 0)
+
+        scheduler.set_target(1)
+
+        assert self.nodes[1].sent == [2, 3]
+        assert self.nodes[1].shutting_down
+        assert not self.nodes[2].shutting_down
+        assert scheduler.parked_nodes() == [self.nodes[2]]
+
+    def test_raising_target_after_shutdown_starts_fresh_worker(self, scheduler):
+        """Test that headroom after a shutdown starts a worker that never ran a test"""
+        scheduler.set_target(2)
+        scheduler.set_target(1)
+
+        scheduler.set_target(2)
+
+        assert self.nodes[2].sent == [4, 5]
+        assert scheduler.live_nodes() == [self.nodes[0], self.nodes[2]]
@@ -0,0 +1,87 @@
+from decimal import Decimal
+import pytest
+from utils.catalog import (
+    PRICE_FORMATS, PriceFormat, assert_sorted, find_order_violation, flatten, iter_prices, price_format
+)
+
+class TestPriceParsing:
+    """Test cases for exact, locale-aware price parsing"""
+    
+    @pytest.mark.parametrize("text, locale_name, expected", [
+        ("$29.99", "en_US", "29.99"),
+        ("$1,299.99", "en_US", "1299.99"),
+        ("1.299,99 €", "de_DE", "1299.99"),
+        ("1 299,99 €", "fr_FR", "1299.99"),
+        ("CHF 1'299.50", "de_CH", "1299.50"),
+        ("-$5.00", "en_US", "-5.00"),
+    ])
+    def test_parse_price(self, text, locale_name, expected):
+        """Test parsing prices in different locales"""
+        assert PRICE_FORMATS[locale_name].parse(text) == Decimal(expected)
+    
+    def test_parse_is_exact(self):
+        """Test that parsed prices add up exactly, unlike floats"""
+        prices = PriceFormat().parse_many(["$0.10", "$0.20"])
+        
+        assert sum(prices) == Decimal("0.30")
+    
+    def test_parse_many(self):
+        """Test that a chunk cleaned in one pass splits back into its prices"""
+        prices = PRICE_FORMATS["de_DE"].parse_many(["1.299,99 €", "0,50 €", "12 €"])
+        
+        assert prices == [Decimal("1299.99"), Decimal("0.50"), Decimal("12")]
+    
+    def test_parse_many_invalid_price(self):
+        """Test that the price that is not a number is named"""
+        with pytest.raises(ValueError, match="'Free'"):
+            PriceFormat().parse_many(["$1.00", "Free"])
+    
+    def test_price_format_from_system_locale(self):
+        """Test that a locale missing from PRICE_FORMATS is read from the locale database"""
+        assert price_format("C").decimal_point == "."
+        with pytest.raises(ValueError):
+            price_format("xx_NOWHERE")
+    
+    def test_parse_invalid_price(self):
+        """Test that text without a number is rejected"""
+        with pytest.raises(ValueError):
+            PriceFormat().parse("Free")
+    
+    def test_iter_prices_streams_chunks(self):
+        """Test parsing a stream of price chunks"""
+        chunks = iter([["$1.00", "$2.50"], ["$3.75"]])
+        
+        assert list(iter_prices(chunks)) == [Decimal("1.00"), Decimal("2.50"), Decimal("3.75")]
+
+class TestOrderCheck:
+    """Test cases for the single-pass order check"""
+    
+    def test_sorted_items(self):
+        """Test that sorted items have no violation"""
+        assert find_order_violation(["a", "b", "b", "c"]) is None
+        assert find_order_violation([3, 2, 2, 1], reverse=True) is None
+        assert find_order_violation([]) is None
+    
+    def test_first_violation_reported(self):
+        """Test that the first out of order item is reported"""
+        assert find_order_violation([1, 3, 2, 0]) == (2, 3, 2)
+    
+    def test_works_on_streams(self):
+        """Test that a generator is checked without being materialised"""
+        items = flatten(iter([list(range(1000)), list(range(1000, 2000))]))
+        
+        assert find_order_violation(items) is None
+    
+    def test_assert_sorted_message(self):
+        """Test that a failed check names the out of order pair"""
+        with pytest.raises(AssertionError, match="index 1: 'b' then 'a'"):
+            assert_sorted(["b", "a"], what="Product names")
+    
+    def test_assert_sorted_empty_stream(self):
+        """Test that a stream with too few items does not pass as sorted"""
+        with pytest.raises(AssertionError, match="Expected at least 6 product names, read 0"):
+            assert_sorted(iter([]), what="Product names", min_count=6)
+    
+    def test_assert_sorted_count(self):
+        """Test that the number of checked items is returned"""
+        assert assert_sorted(flatten(iter([[1, 2], [3]]))) == 3
@@ -52,6 +52,18 @@ class TestCheckout:
         
         self.checkout_page.expect_on_overview_page()
     
+    def test_fill_and_continue(self, page: Page):
+        """Test filling checkout information and proceeding in one composite action"""
+        self.cart_page.proceed_to_checkout()
+        
+        self.checkout_page.fill_and_continue(
+            CHECKOUT_INFO["first_name"],
+            CHECKOUT_INFO["last_name"],
+            CHECKOUT_INFO["postal_code"]
+        )
+        
+        self.checkout_page.expect_on_overview_page()
+    
     def test_checkout_with_empty_first_name(self, page: Page):
         """Test validation when first name is empty"""
         self.cart_page.proceed_to_checkout()
@@ -0,0 +1,149 @@
+import socket
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from utils.distributed import Coordinator, Dispatcher, agent_args, parse_address
+
+ROOT = Path(__file__).parent.parent
+
+def nodeids(count):
+    return [f"tests/test_x.py::test_{index}" for index in range(count)]
+
+class TestDispatcher:
+    """Test cases for handing out, stealing and requeueing tests"""
+
+    def test_batches_shrink(self):
+        """Test that batches get smaller as the queue drains"""
+        dispatcher = Dispatcher(nodeids(40), max_batch=16)
+        dispatcher.add_agent("a")
+        dispatcher.add_agent("b")
+
+        sizes = [len(dispatcher.request(agent)) for agent in ["a", "b", "a", "b"]]
+
+        assert sizes == [10, 7, 5, 4]
+
+    def test_parks_agent_when_queue_empty(self):
+        """Test that an agent asking for work with an empty queue is parked and served on requeue"""
+        dispatcher = Dispatcher(nodeids(1))
+        dispatcher.add_agent("a")
+        dispatcher.add_agent("b")
+        dispatcher.request("a")
+
+        assert dispatcher.request("b") == []
+        assert dispatcher.waiting == ["b"]
+        requeued, crashed = dispatcher.remove_agent("a")
+        assert requeued == nodeids(1)
+        assert crashed == []
+        assert dispatcher.serve_waiting() == [("b", nodeids(1))]
+
+    def test_steal_half_of_unstarted(self):
+        """Test that an idle agent steals half of the busiest agent's unstarted tests"""
+        dispatcher = Dispatcher(nodeids(6))
+        dispatcher.add_agent("a")
+        while dispatcher.queue:
+            dispatcher.request("a")
+        batch = list(dispatcher.assigned["a"])
+        dispatcher.start(batch[0])
+        dispatcher.add_agent("b")
+        dispatcher.request("b")
+
+        assert dispatcher.steal("b") == ("a", 2)
+        assert dispatcher.stolen("a", batch[-2:]) == [("b", batch[-2:])]
+        assert dispatcher.assigned["a"] == batch[:-2]
+        assert dispatcher.waiting == []
+
+    def test_nothing_to_steal(self):
+        """Test that an agent keeps the test it has lined up next"""
+        dispatcher = Dispatcher(nodeids(1))
+        dispatcher.add_agent("a")
+        dispatcher.add_agent("b")
+        dispatcher.request("a")
+
+        assert dispatcher.steal("b") is None
+
+    def test_stolen_tests_queued_without_thief(self):
+        """Test that tests given up after the thief was lost go back to the queue"""
+        dispatcher = Dispatcher(nodeids(2))
+        dispatcher.add_agent("a")
+        dispatcher.add_agent("b")
+        dispatcher.request("a")
+        dispatcher.request("a")
+        dispatcher.request("b")
+        dispatcher.steal("b")
+        dispatcher.remove_agent("b")
+
+        assert dispatcher.stolen("a", nodeids(2)[-1:]) == []
+        assert list(dispatcher.queue) == nodeids(2)[-1:]
+
+    def test_lost_agent(self):
+        """Test that a lost agent's running test crashes and the rest is requeued in order"""
+        dispatcher = Dispatcher(nodeids(8), max_batch=4)
+        dispatcher.add_agent("a")
+        batch = dispatcher.request("a")
+        dispatcher.start(batch[0])
+        dispatcher.complete("a", batch[0])
+        dispatcher.start(batch[1])
+
+        requeued, crashed = dispatcher.remove_agent("a")
+
+        assert crashed == [batch[1]]
+        assert requeued == batch[2:]
+        assert list(dispatcher.queue)[:2] == batch[2:]
+        assert not dispatcher.done
+
+    def test_done(self):
+        """Test that the run is done once every test is completed"""
+        dispatcher = Dispatcher(nodeids(2))
+        dispatcher.add_agent("a")
+        for nodeid in dispatcher.request("a") + dispatcher.request("a"):
+            dispatcher.complete("a", nodeid)
+
+        assert dispatcher.done
+
+class TestCommandLine:
+    """Test cases for coordinator addresses and local agent arguments"""
+
+    @pytest.mark.parametrize("address, expected", [
+        ("127.0.0.1:8765", (socket.AF_INET, ("127.0.0.1", 8765))),
+        ("unix:/tmp/coordinator.sock", (socket.AF_UNIX, "/tmp/coordinator.sock")),
+    ])
+    def test_parse_address(self, address, expected):
+        """Test TCP and Unix socket addresses"""
+        assert parse_address(address) == expected
+
+    def test_parse_invalid_address(self):
+        """Test that an address without a port is rejected"""
+        with pytest.raises(pytest.UsageError):
+            parse_address("localhost")
+
+    def test_agent_args(self):
+        """Test that agents get the coordinator's arguments without the coordinator options"""
+        args = ["tests", "--coordinator", "127.0.0.1:0", "--local-agents=3", "-m", "smoke"]
+
+        assert agent_args(args) == ["tests", "-m", "smoke"]
+
+class TestLocalAgents:
+    """Test cases running a coordinator with agents on localhost"""
+
+    def test_hung_agent_terminated(self, pytestconfig, monkeypatch):
+        """Test that a local agent that does not exit after the run is terminated"""
+        monkeypatch.setattr("utils.distributed.AGENT_EXIT_TIMEOUT", 0.1)
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+
+        Coordinator(pytestconfig, "127.0.0.1:0")._reap(process)
+
+        assert process.returncode is not None
+
+    def test_run_with_two_agents(self):
+        """Test that two local agents run every test and the coordinator reports them all"""
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "tests/test_catalog.py", "-p", "no:cacheprovider",
+             "--coordinator", "127.0.0.1:0", "--local-agents", "2"],
+            cwd=ROOT, capture_output=True, text=True, timeout=120,
+        )
+
+        assert result.returncode == 0, result.stdout
+        assert result.stdout.count("[coordinator] agent") == 2
+        summary = result.stdout.splitlines()[-1]
+        assert " passed" in summary and "failed" not in summary
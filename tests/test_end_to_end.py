@@ -97,6 +97,23 @@ class TestEndToEnd:
         # Verify completion
         self.checkout_page.expect_order_complete()
     
+    def test_purchase_with_composite_actions(self, page: Page):
+        """Test purchasing items with the batched composite actions"""
+        self.login_page.quick_login(VALID_USERNAME, VALID_PASSWORD)
+        self.inventory_page.add_items_to_cart([PRODUCT_BACKPACK, PRODUCT_BIKE_LIGHT])
+        self.inventory_page.expect_cart_badge_count("2")
+        
+        self.inventory_page.click_cart()
+        self.cart_page.proceed_to_checkout()
+        self.checkout_page.complete_checkout(
+            CHECKOUT_INFO_ALT["first_name"],
+            CHECKOUT_INFO_ALT["last_name"],
+            CHECKOUT_INFO_ALT["postal_code"]
+        )
+        
+        self.checkout_page.expect_on_complete_page()
+        self.checkout_page.expect_order_complete()
+    
     def test_modify_cart_before_checkout(self, page: Page):
         """Test modifying cart items before completing checkout"""
         # Login and add items
@@ -0,0 +1,103 @@
+import json
+from utils.har import HarSession, HarStore, har_key
+
+def har(*entries):
+    """Minimal HAR document with one entry per (method, url, body)"""
+    return {"log": {"version": "1.2", "entries": [
+        {"request": {"method": method, "url": url}, "response": {"status": 200, "content": {"text": body}}}
+        for method, url, body in entries
+    ]}}
+
+def write_part(store, name, nodeid, document):
+    store.root.mkdir(parents=True, exist_ok=True)
+    store.part_path(name, nodeid).write_text(json.dumps(document))
+
+class TestHarStore:
+    """Test cases for the HAR archive store"""
+
+    def test_har_key(self):
+        """Test that node ids turn into file-safe names"""
+        assert har_key("tests/test_cart.py::TestCart::test_add[1]") == "tests-test_cart.py-TestCart-test_add-1"
+
+    def test_discard(self, tmp_path):
+        """Test that a discarded archive is gone and discarding twice is harmless"""
+        store = HarStore(str(tmp_path / "hars"))
+        store.root.mkdir()
+        store.path_for("checkout-flow").write_text("{}")
+
+        store.discard("checkout-flow")
+        store.discard("checkout-flow")
+
+        assert not store.has("checkout-flow")
+
+    def test_pack_and_unpack(self, tmp_path):
+        """Test that the store survives a round trip through its zip"""
+        store = HarStore(str(tmp_path / "hars"))
+        store.root.mkdir()
+        store.path_for("checkout-flow").write_text("{}")
+        (store.root / "0a1b.js").write_text("body")
+        store.pack()
+        for file in store.root.iterdir():
+            file.unlink()
+        store.root.rmdir()
+
+        store.unpack()
+
+        assert sorted(file.name for file in store.root.iterdir()) == ["0a1b.js", "checkout-flow.har"]
+
+    def test_merge_parts(self, tmp_path):
+        """Test that the parts recorded by the tests of a flow are merged into one archive"""
+        store = HarStore(str(tmp_path / "hars"))
+        write_part(store, "checkout-flow", "test_a", har(("GET", "/inventory", "a"), ("GET", "/cart", "a")))
+        write_part(store, "checkout-flow", "test_b", har(("GET", "/cart", "b"), ("POST", "/order", "b")))
+        write_part(store, "tests/test_login.py::test_ok", "tests/test_login.py::test_ok", har(("GET", "/", "c")))
+
+        keys = store.merge_parts()
+
+        assert sorted(keys) == ["checkout-flow", "tests-test_login.py-test_ok"]
+        entries = json.loads(store.path_for("checkout-flow").read_text())["log"]["entries"]
+        assert [(entry["request"]["url"], entry["response"]["content"]["text"]) for entry in entries] == [
+            ("/inventory", "a"), ("/cart", "a"), ("/order", "b")
+        ]
+        assert list(store.root.glob("*@*.har")) == []
+
+    def test_discard_stale(self, tmp_path):
+        """Test that archives which missed requests are dropped at the end of the session"""
+        store = HarStore(str(tmp_path / "hars"))
+        store.root.mkdir()
+        store.path_for("checkout-flow").write_text("{}")
+        session = HarSession(store, "checkout-flow", "test_a", "replay")
+        session.misses.add("https://www.saucedemo.com/new-endpoint")
+
+        session.finish()
+
+        assert store.has("checkout-flow")
+        store.discard_stale()
+        assert not store.has("checkout-flow")
+
+class TestHarSession:
+    """Test cases for choosing between record and replay"""
+
+    def test_replay_without_archive_records(self, tmp_path):
+        """Test that replaying a missing archive records it instead"""
+        store = HarStore(str(tmp_path / "hars"))
+
+        assert HarSession(store, "checkout-flow", "test_a", "replay").mode == "record"
+
+    def test_replay_with_archive(self, tmp_path):
+        """Test that an existing archive is replayed"""
+        store = HarStore(str(tmp_path / "hars"))
+        store.root.mkdir()
+        store.path_for("checkout-flow").write_text("{}")
+
+        assert HarSession(store, "checkout-flow", "test_a", "replay").mode == "replay"
+
+    def test_replay_without_misses_keeps_archive(self, tmp_path):
+        """Test that a clean replay does not mark the archive stale"""
+        store = HarStore(str(tmp_path / "hars"))
+        store.root.mkdir()
+        store.path_for("checkout-flow").write_text("{}")
+
+        HarSession(store, "checkout-flow", "test_a", "replay").finish()
+
+        assert store.stale == set()
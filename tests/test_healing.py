@@ -0,0 +1,187 @@
+import json
+from utils.healing import HealingLocator, LocatorCache
+
+class FakeLocator:
+    """Stand-in for a Playwright locator matching a fixed set of selectors"""
+
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    def or_(self, other):
+        return self
+
+    def wait_for(self, state):
+        self.page.waits += 1
+
+    def count(self):
+        self.page.probes.append(self.selector)
+        return 1 if self.selector in self.page.matching else 0
+
+class FakePage:
+    """Stand-in for a Playwright page with the selectors that currently match"""
+
+    def __init__(self, matching):
+        self.matching = set(matching)
+        self.waits = 0
+        self.probes = []
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+class LoginLocators:
+    LOGIN_BUTTON = HealingLocator("#login-button", data_test="login-button", role="button",
+                                  name="Login", text="Login", alternatives=("form input[type=submit]",))
+
+class TestHealingLocator:
+    """Test cases for locator strings with fallback strategies"""
+
+    def test_is_plain_selector(self):
+        """Test that a healing locator is used like its primary selector"""
+        assert LoginLocators.LOGIN_BUTTON == "#login-button"
+        assert f"{LoginLocators.LOGIN_BUTTON} span" == "#login-button span"
+
+    def test_fallback_order(self):
+        """Test that fallbacks are ranked data-test, role, text, CSS"""
+        assert LoginLocators.LOGIN_BUTTON.fallbacks == [
+            '[data-test="login-button"]',
+            'role=button[name="Login"]',
+            'text="Login"',
+            "form input[type=submit]",
+        ]
+
+    def test_owner_name(self):
+        """Test that a locator knows the page object constant it is defined as"""
+        assert LoginLocators.LOGIN_BUTTON.owner == "LoginLocators.LOGIN_BUTTON"
+
+class TestLocatorCache:
+    """Test cases for resolving and caching healed selectors"""
+
+    def test_primary_matches(self):
+        """Test that a working primary selector is used and only probed once"""
+        cache = LocatorCache()
+        page = FakePage({"#login-button"})
+
+        assert cache.resolve(page, LoginLocators.LOGIN_BUTTON) == "#login-button"
+        assert cache.resolve(page, LoginLocators.LOGIN_BUTTON) == "#login-button"
+        assert page.waits == 1
+        assert cache.report == {}
+
+    def test_heals_to_first_matching_fallback(self):
+        """Test that a broken primary selector heals to the best ranked fallback that matches"""
+        cache = LocatorCache()
+        page = FakePage({'role=button[name="Login"]', 'text="Login"'})
+
+        assert cache.resolve(page, LoginLocators.LOGIN_BUTTON) == 'role=button[name="Login"]'
+        assert cache.report["#login-button"] == {
+            "locator": "LoginLocators.LOGIN_BUTTON",
+            "healed": 'role=button[name="Login"]',
+        }
+
+    def test_healed_selector_skips_probing(self):
+        """Test that a healed selector is used directly on later lookups"""
+        cache = LocatorCache()
+        page = FakePage({'[data-test="login-button"]'})
+        cache.resolve(page, LoginLocators.LOGIN_BUTTON)
+        page.probes.clear()
+
+        assert cache.resolve(page, LoginLocators.LOGIN_BUTTON) == '[data-test="login-button"]'
+        assert page.probes == []
+
+    def test_no_match_without_wait(self):
+        """Test that an absent element resolves to the primary selector and is not remembered"""
+        cache = LocatorCache()
+        page = FakePage(set())
+
+        assert cache.resolve(page, LoginLocators.LOGIN_BUTTON, wait=False) == "#login-button"
+        assert page.waits == 0
+        assert cache.verified == set()
+
+    def test_plain_selector_untouched(self):
+        """Test that plain string selectors are not resolved"""
+        page = FakePage(set())
+
+        assert LocatorCache().resolve(page, "#login-button") == "#login-button"
+        assert page.probes == []
+
+    def test_no_heal_without_wait(self):
+        """Test that a presence check does not heal on whatever happens to match at the moment"""
+        cache = LocatorCache()
+        page = FakePage({'[data-test="login-button"]'})
+
+        assert cache.resolve(page, LoginLocators.LOGIN_BUTTON, wait=False) == "#login-button"
+        assert page.probes == []
+        assert cache.healed == {}
+
+    def test_cached_heal_without_wait(self):
+        """Test that a presence check uses a heal learned by an earlier lookup"""
+        cache = LocatorCache()
+        cache.resolve(FakePage({'text="Login"'}), LoginLocators.LOGIN_BUTTON)
+
+        assert cache.resolve(FakePage(set()), LoginLocators.LOGIN_BUTTON, wait=False) == 'text="Login"'
+
+    def test_save_and_load(self, tmp_path):
+        """Test that healed selectors are merged into the cache file and tried first by the next run"""
+        path = tmp_path / "locators.json"
+        path.write_text(json.dumps({"#other": ".other"}))
+        cache = LocatorCache()
+        cache.load(str(path))
+        cache.resolve(FakePage({'text="Login"'}), LoginLocators.LOGIN_BUTTON)
+        cache.save()
+
+        next_run = LocatorCache()
+        next_run.load(str(path))
+        page = FakePage({'[data-test="login-button"]', 'text="Login"'})
+
+        assert next_run.healed == {"#other": ".other", "#login-button": 'text="Login"'}
+        assert next_run.resolve(page, LoginLocators.LOGIN_BUTTON) == 'text="Login"'
+        assert page.probes == ['text="Login"']
+        assert next_run.drain() == {}
+
+    def test_stale_heal_healed_again(self):
+        """Test that a cached heal that stopped matching is replaced by the fallback that matches now"""
+        cache = LocatorCache()
+        cache.healed["#login-button"] = 'text="Login"'
+
+        assert cache.resolve(FakePage({'[data-test="login-button"]'}), LoginLocators.LOGIN_BUTTON) == (
+            '[data-test="login-button"]'
+        )
+        assert cache.healed == {"#login-button": '[data-test="login-button"]'}
+
+    def test_stale_heal_dropped(self, tmp_path):
+        """Test that a cached heal is dropped from the cache file once the primary selector matches again"""
+        path = tmp_path / "locators.json"
+        path.write_text(json.dumps({"#login-button": 'text="Login"', "#other": ".other"}))
+        cache = LocatorCache()
+        cache.load(str(path))
+
+        assert cache.resolve(FakePage({"#login-button"}), LoginLocators.LOGIN_BUTTON) == "#login-button"
+        cache.save()
+        assert json.loads(path.read_text()) == {"#other": ".other"}
+
+    def test_drain_and_merge(self):
+        """Test that heals are shipped once from a worker and merged on the controller"""
+        worker = LocatorCache()
+        worker.resolve(FakePage({'text="Login"'}), LoginLocators.LOGIN_BUTTON)
+        controller = LocatorCache()
+
+        controller.merge(worker.drain())
+
+        assert worker.drain() == {}
+        assert controller.healed == {"#login-button": 'text="Login"'}
+        assert controller.report["#login-button"]["locator"] == "LoginLocators.LOGIN_BUTTON"
+
+    def test_drop_shipped_to_controller(self):
+        """Test that a heal dropped on a worker is also dropped on the controller"""
+        worker = LocatorCache()
+        worker.healed["#login-button"] = 'text="Login"'
+        worker.resolve(FakePage({"#login-button"}), LoginLocators.LOGIN_BUTTON)
+        controller = LocatorCache()
+        controller.healed["#login-button"] = 'text="Login"'
+
+        controller.merge(worker.drain())
+
+        assert controller.healed == {}
+        assert controller.dropped == {"#login-button"}
+        assert controller.report == {}
@@ -2,6 +2,8 @@ import pytest
 from playwright.sync_api import Page
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
+from pages.base_page import ReadOnlyError
+from utils.catalog import assert_sorted
 from utils.test_data import (
     VALID_USERNAME, 
     VALID_PASSWORD,
@@ -25,10 +27,6 @@ class TestInventory:
         self.login_page.login(VALID_USERNAME, VALID_PASSWORD)
         self.login_page.wait_for_url(f"{self.login_page.base_url}/inventory.html")
     
-    def test_products_displayed(self, page: Page):
-        """Test that 6 products are displayed"""
-        self.inventory_page.expect_product_count(6)
-    
     def test_add_single_item_to_cart(self, page: Page):
         """Test adding a single item to cart"""
         self.inventory_page.add_item_to_cart(PRODUCT_BACKPACK)
@@ -42,6 +40,12 @@ class TestInventory:
         
         self.inventory_page.expect_cart_badge_count("2")
     
+    def test_add_items_to_cart_in_one_call(self, page: Page):
+        """Test adding multiple items to cart with the composite action"""
+        self.inventory_page.add_items_to_cart([PRODUCT_BACKPACK, PRODUCT_BIKE_LIGHT])
+        
+        self.inventory_page.expect_cart_badge_count("2")
+    
     def test_remove_item_from_cart(self, page: Page):
         """Test removing an item from cart"""
         self.inventory_page.add_item_to_cart(PRODUCT_BACKPACK)
@@ -49,36 +53,52 @@ class TestInventory:
         
         self.inventory_page.expect_cart_badge_not_visible()
     
-    def test_sort_products_az(self, page: Page):
+    def test_cart_navigation(self, page: Page):
+        """Test clicking cart icon navigates to cart page"""
+        self.inventory_page.click_cart()
+        
+        self.inventory_page.expect_url(f"{self.inventory_page.base_url}/cart.html")
+
+class TestInventoryReadOnly:
+    """Read-only inventory checks on pre-loaded tabs of one shared logged-in context"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, readonly_page: Page):
+        """Bind the inventory page object to a read-only tab"""
+        self.inventory_page = InventoryPage(readonly_page)
+    
+    def test_products_displayed(self, readonly_page: Page):
+        """Test that 6 products are displayed"""
+        self.inventory_page.expect_product_count(6)
+    
+    def test_sort_products_az(self, readonly_page: Page):
         """Test sorting products A to Z"""
         self.inventory_page.sort_products(SORT_AZ)
         
-        product_names = self.inventory_page.get_product_names()
-        assert product_names == sorted(product_names), "Products are not sorted A-Z"
+        assert_sorted(self.inventory_page.iter_product_names(), what="Product names", min_count=6)
     
-    def test_sort_products_za(self, page: Page):
+    def test_sort_products_za(self, readonly_page: Page):
         """Test sorting products Z to A"""
         self.inventory_page.sort_products(SORT_ZA)
         
-        product_names = self.inventory_page.get_product_names()
-        assert product_names == sorted(product_names, reverse=True), "Products are not sorted Z-A"
+        assert_sorted(self.inventory_page.iter_product_names(), reverse=True, what="Product names", min_count=6)
     
-    def test_sort_products_price_low_to_high(self, page: Page):
+    def test_sort_products_price_low_to_high(self, readonly_page: Page):
         """Test sorting products by price (low to high)"""
         self.inventory_page.sort_products(SORT_PRICE_LOW_HIGH)
         
-        prices = self.inventory_page.get_product_prices()
-        assert prices == sorted(prices), "Products are not sorted by price (low to high)"
+        assert_sorted(self.inventory_page.iter_product_prices(), what="Product prices", min_count=6)
     
-    def test_navigate_to_product_details(self, page: Page):
+    def test_navigate_to_product_details(self, readonly_page: Page):
         """Test navigating to product details page"""
         self.inventory_page.click_product("4")
         
         self.inventory_page.expect_url(f"{self.inventory_page.base_url}/inventory-item.html?id=4")
         assert self.inventory_page.is_visible(".inventory_details_name")
     
-    def test_cart_navigation(self, page: Page):
-        """Test clicking cart icon navigates to cart page"""
-        self.inventory_page.click_cart()
+    def test_state_changing_action_blocked(self, readonly_page: Page):
+        """Test that adding to cart is blocked on a read-only tab"""
+        with pytest.raises(ReadOnlyError):
+            self.inventory_page.add_item_to_cart(PRODUCT_BACKPACK)
         
-        self.inventory_page.expect_url(f"{self.inventory_page.base_url}/cart.html")
\ No newline at end of file
+        self.inventory_page.expect_cart_badge_not_visible()
\ No newline at end of file
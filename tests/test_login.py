@@ -28,6 +28,12 @@ class TestLogin:
         self.login_page.expect_login_successful()
         assert self.inventory_page.get_page_title() == "Products"
     
+    def test_quick_login(self, page: Page):
+        """Test login with both fields filled in one round trip"""
+        self.login_page.quick_login(VALID_USERNAME, VALID_PASSWORD)
+        
+        self.login_page.expect_login_successful()
+    
     def test_login_with_invalid_credentials(self, page: Page):
         """Test login with invalid credentials"""
         self.login_page.login(INVALID_USERNAME, INVALID_PASSWORD)
@@ -0,0 +1,177 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from utils.page_events import PageEventCollector, PageEventSummary, SLOWEST_REQUESTS
+
+ROOT = Path(__file__).parent.parent
+
+# Browser test run against the repo's conftest, with a fake page raising one page error
+FAILING_PAGE_TEST = """
+import pytest
+
+class FakePage:
+    url = "https://www.saucedemo.com/inventory.html"
+
+    def on(self, event, handler):
+        if event == "pageerror":
+            self.raise_error = handler
+
+class FakeError:
+    message = "TypeError: x is undefined"
+
+@pytest.fixture
+def page():
+    return FakePage()
+
+def test_raises_page_error(page):
+    page.raise_error(FakeError())
+"""
+
+class FakePage:
+    """Stand-in for a Playwright page that records its event handlers"""
+
+    def __init__(self, url):
+        self.url = url
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit(self, event, payload):
+        self.handlers[event](payload)
+
+class FakeConsoleMessage:
+    def __init__(self, type, text):
+        self.type = type
+        self.text = text
+
+class FakeError:
+    def __init__(self, message):
+        self.message = message
+
+class FakeRequest:
+    def __init__(self, url, duration, resource_type="document", failure=None):
+        self.url = url
+        self.method = "GET"
+        self.resource_type = resource_type
+        self.timing = {"responseEnd": duration}
+        self.failure = failure
+
+class TestPageEventCollector:
+    """Test cases for page event aggregation"""
+
+    def setup_method(self):
+        self.page = FakePage("https://www.saucedemo.com/inventory.html?id=4")
+        self.collector = PageEventCollector.attach(self.page)
+
+    def teardown_method(self):
+        self.page.emit("close", self.page)
+
+    def test_attach_is_idempotent(self):
+        """Test that page objects on the same page share one collector"""
+        assert PageEventCollector.attach(self.page) is self.collector
+        assert PageEventCollector.for_page(self.page) is self.collector
+
+    def test_errors_counted_per_url(self):
+        """Test that errors are counted per page URL without the query"""
+        self.page.emit("console", FakeConsoleMessage("error", "boom"))
+        self.page.emit("console", FakeConsoleMessage("error", "boom"))
+        self.page.emit("console", FakeConsoleMessage("log", "fine"))
+        self.page.emit("requestfailed", FakeRequest("https://api.example.com/x", -1, failure="net::ERR"))
+
+        counter = self.collector.counters["https://www.saucedemo.com/inventory.html"]
+        assert counter["console_error"] == 2
+        assert counter["request_failed"] == 1
+        assert len(self.collector.signatures) == 2
+
+    def test_only_slowest_backend_requests_kept(self):
+        """Test that only the slowest backend requests are retained"""
+        for duration in range(SLOWEST_REQUESTS + 5):
+            self.page.emit("requestfinished", FakeRequest(f"https://www.saucedemo.com/{duration}", duration * 100))
+        self.page.emit("requestfinished", FakeRequest("https://www.saucedemo.com/logo.png", 9999, "image"))
+
+        assert len(self.collector.slowest) == SLOWEST_REQUESTS
+        assert min(self.collector.slowest)[0] == 500
+        assert self.collector.counters["https://www.saucedemo.com/inventory.html"]["slow_response"] == 5
+
+    def test_reset(self):
+        """Test that a pooled tab's collector starts each test from zero"""
+        self.page.emit("pageerror", FakeError("TypeError: x is undefined"))
+        self.page.emit("requestfinished", FakeRequest("https://www.saucedemo.com/cart", 1500))
+
+        self.collector.reset()
+
+        assert self.collector.to_dict() == {"counters": {}, "signatures": [], "slowest": []}
+
+    def test_summary_merges_tests(self):
+        """Test that the run summary merges counters and signatures of each test"""
+        self.page.emit("pageerror", FakeError("TypeError: x is undefined"))
+        summary = PageEventSummary(baseline=set())
+        summary.add("test_a", self.collector.to_dict())
+        summary.add("test_b", self.collector.to_dict())
+
+        assert summary.per_url["https://www.saucedemo.com/inventory.html"]["page_error"] == 2
+        assert set(summary.per_test) == {"test_a", "test_b"}
+        assert summary.signatures - summary.baseline
+
+    def test_summary_merges_shipped_reports(self):
+        """Test that counters survive the JSON round trip of an xdist report"""
+        self.page.emit("requestfinished", FakeRequest("https://www.saucedemo.com/cart", 1500))
+        summary = PageEventSummary()
+        summary.add("test_a", json.loads(json.dumps(self.collector.to_dict())))
+
+        assert summary.per_url["https://www.saucedemo.com/inventory.html"]["slow_response"] == 1
+        assert summary.slowest_requests() == [(1500, "GET https://www.saucedemo.com/cart")]
+
+class TestDisabledCollection:
+    """Test cases for --page-errors=off"""
+
+    def test_no_listeners_when_disabled(self, monkeypatch):
+        """Test that pages get no event listeners when collection is off"""
+        monkeypatch.setattr(PageEventCollector, "enabled", False)
+        page = FakePage("https://www.saucedemo.com/")
+
+        assert PageEventCollector.attach(page) is None
+        assert page.handlers == {}
+
+class TestFailOnNewErrors:
+    """Test cases for failing browser tests on errors missing from the baseline"""
+
+    def run(self, tmp_path, *args):
+        """Run the fake browser test with the page_events fixture of the repo's conftest"""
+        test_file = tmp_path / "test_fake_page.py"
+        test_file.write_text(FAILING_PAGE_TEST)
+        return subprocess.run(
+            [sys.executable, "-m", "pytest", str(test_file), "-p", "conftest", "-p", "no:cacheprovider",
+             "--rootdir", str(tmp_path), *args],
+            cwd=ROOT, capture_output=True, text=True, timeout=60,
+        )
+
+    def test_new_error_fails(self, tmp_path):
+        """Test that an error missing from the baseline fails the test"""
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text("[]")
+
+        result = self.run(tmp_path, "--page-errors", "fail", "--page-errors-baseline", str(baseline))
+
+        assert result.returncode == 1, result.stdout
+        assert "New page errors:" in result.stdout
+        assert "page_error https://www.saucedemo.com/inventory.html TypeError" in result.stdout
+
+    def test_known_error_passes(self, tmp_path):
+        """Test that an error already in the baseline does not fail the test"""
+        baseline = tmp_path / "baseline.json"
+        self.run(tmp_path, "--page-errors-baseline", str(baseline))
+
+        result = self.run(tmp_path, "--page-errors", "fail", "--page-errors-baseline", str(baseline))
+
+        assert len(json.loads(baseline.read_text())) == 1
+        assert result.returncode == 0, result.stdout
+
+    def test_fail_needs_baseline(self, tmp_path):
+        """Test that --page-errors fail without a baseline file is a usage error"""
+        result = self.run(tmp_path, "--page-errors", "fail", "--page-errors-baseline", str(tmp_path / "none.json"))
+
+        assert result.returncode == 4
+        assert "needs an existing --page-errors-baseline" in result.stderr
@@ -0,0 +1,184 @@
+import pytest
+from playwright.sync_api import Page
+from pages.inventory_page import InventoryPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from utils.har import HarStore
+from utils.snapshots import (
+    SNAPSHOT_BUILDERS, SNAPSHOT_LOGGED_IN, SNAPSHOT_CART, SNAPSHOT_CHECKOUT_OVERVIEW, AppSnapshot,
+    SnapshotDriftError, SnapshotStore
+)
+from utils.test_data import PRODUCT_BACKPACK, SUCCESS_ORDER_COMPLETE
+
+class FakeSnapshot:
+    """Stand-in for a captured snapshot that records its restores"""
+
+    def __init__(self, valid):
+        self.valid = valid
+        self.restored = 0
+
+    def restore(self, page):
+        self.restored += 1
+        page.snapshot = self
+
+class FakePage:
+    """Stand-in for a page that remembers the last snapshot restored into it"""
+    snapshot = None
+
+class RebuildingStore(SnapshotStore):
+    """Snapshot store whose builds are a list of canned snapshots"""
+
+    def __init__(self, *snapshots):
+        super().__init__(browser=None, context_args={})
+        self.builds = list(snapshots)
+
+    def get(self, name):
+        if name not in self.snapshots:
+            self.snapshots[name] = self.builds.pop(0)
+        return self.snapshots[name]
+
+class TestSnapshotStore:
+    """Test cases for rebuilding snapshots that drifted from the app"""
+
+    @pytest.fixture(autouse=True)
+    def check(self, monkeypatch):
+        """Register a snapshot whose check passes only for valid fakes"""
+        def check_valid(page):
+            assert page.snapshot.valid, "stale snapshot"
+        monkeypatch.setitem(SNAPSHOT_BUILDERS, "fake", (None, check_valid))
+
+    def test_drifted_snapshot_rebuilt(self):
+        """Test that a stale snapshot is rebuilt and restored again"""
+        stale, fresh = FakeSnapshot(valid=False), FakeSnapshot(valid=True)
+        store = RebuildingStore(stale, fresh)
+
+        store.restore(FakePage(), "fake")
+
+        assert (stale.restored, fresh.restored) == (1, 1)
+        assert store.snapshots["fake"] is fresh
+
+    def test_drift_after_rebuild(self):
+        """Test that a snapshot still failing after a rebuild raises SnapshotDriftError"""
+        store = RebuildingStore(FakeSnapshot(valid=False), FakeSnapshot(valid=False))
+
+        with pytest.raises(SnapshotDriftError, match="stale snapshot"):
+            store.restore(FakePage(), "fake")
+        assert store.snapshots == {}
+
+class FakeContext:
+    """Stand-in for a build context that records how it was routed"""
+
+    def __init__(self):
+        self.hars = []
+        self.closed = False
+
+    def route(self, url, handler):
+        pass
+
+    def route_from_har(self, path, **options):
+        self.hars.append((path.name, options.get("update", False)))
+
+    def new_page(self):
+        return FakePage()
+
+    def close(self):
+        self.closed = True
+
+class FakeBrowser:
+    """Stand-in for a browser that remembers the contexts it created"""
+
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **context_args):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+class TestSnapshotHar:
+    """Test cases for routing snapshot builds through the HAR store"""
+
+    @pytest.fixture(autouse=True)
+    def builder(self, monkeypatch):
+        """Register a snapshot whose build and capture do nothing"""
+        monkeypatch.setitem(SNAPSHOT_BUILDERS, "fake", (lambda page: None, None))
+        monkeypatch.setattr(AppSnapshot, "capture", classmethod(lambda cls, name, page: FakeSnapshot(valid=True)))
+
+    def test_build_recorded(self, tmp_path):
+        """Test that a snapshot without an archive is recorded into a per-worker part"""
+        browser = FakeBrowser()
+        store = SnapshotStore(browser, {}, har_store=HarStore(tmp_path), har_mode="replay", worker="gw1")
+
+        store.get("fake")
+
+        context, = browser.contexts
+        assert context.hars == [("snapshot-fake@gw1.har", True)]
+        assert context.closed
+
+    def test_build_replayed(self, tmp_path):
+        """Test that a snapshot with an archive is built from it"""
+        har_store = HarStore(tmp_path)
+        har_store.path_for("snapshot-fake").write_text("{}")
+        browser = FakeBrowser()
+
+        SnapshotStore(browser, {}, har_store=har_store, har_mode="replay").get("fake")
+
+        assert browser.contexts[0].hars == [("snapshot-fake.har", False)]
+
+    def test_drifted_build_recorded(self, tmp_path):
+        """Test that a drifted snapshot is rebuilt from the network, not its archive"""
+        har_store = HarStore(tmp_path)
+        har_store.path_for("snapshot-fake").write_text("{}")
+        browser = FakeBrowser()
+        store = SnapshotStore(browser, {}, har_store=har_store, har_mode="replay")
+        store.drifted.add("fake")
+
+        store.get("fake")
+
+        assert browser.contexts[0].hars == [("snapshot-fake@main.har", True)]
+
+    def test_har_off(self, tmp_path):
+        """Test that builds are not routed with --har-mode off"""
+        browser = FakeBrowser()
+
+        SnapshotStore(browser, {}, har_store=HarStore(tmp_path)).get("fake")
+
+        assert browser.contexts[0].hars == []
+
+class TestSnapshots:
+    """Test cases starting from restored app state snapshots"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, page: Page):
+        """Initialize page objects"""
+        self.inventory_page = InventoryPage(page)
+        self.cart_page = CartPage(page)
+        self.checkout_page = CheckoutPage(page)
+    
+    def test_start_logged_in(self, restore_snapshot):
+        """Test starting on the inventory page as a logged in user"""
+        restore_snapshot(SNAPSHOT_LOGGED_IN)
+        
+        self.inventory_page.add_item_to_cart(PRODUCT_BACKPACK)
+        self.inventory_page.expect_cart_badge_count("1")
+    
+    def test_start_with_cart(self, restore_snapshot):
+        """Test starting with the backpack and bike light in the cart"""
+        restore_snapshot(SNAPSHOT_CART)
+        
+        self.inventory_page.click_cart()
+        self.cart_page.expect_cart_item_count(2)
+    
+    def test_start_at_checkout_overview(self, restore_snapshot):
+        """Test finishing an order from the checkout overview"""
+        restore_snapshot(SNAPSHOT_CHECKOUT_OVERVIEW)
+        
+        self.checkout_page.click_finish()
+        self.checkout_page.expect_on_complete_page()
+        assert self.checkout_page.get_completion_message() == SUCCESS_ORDER_COMPLETE
+    
+    def test_restore_twice(self, restore_snapshot):
+        """Test that a second restore in the same test replaces the first one's state"""
+        restore_snapshot(SNAPSHOT_CART)
+        restore_snapshot(SNAPSHOT_LOGGED_IN)
+        
+        self.inventory_page.expect_cart_badge_not_visible()
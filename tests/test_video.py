@@ -0,0 +1,103 @@
+import os
+import pytest
+from utils.video import VideoRecorder, VideoStats, enforce_disk_cap, transcode
+
+class FakeVideo:
+    """Stand-in for a Playwright video backed by a file"""
+
+    def __init__(self, path):
+        self._path = path
+        self.deleted = False
+
+    def path(self):
+        return self._path
+
+    def delete(self):
+        os.unlink(self._path)
+        self.deleted = True
+
+def write_video(path, size):
+    path.write_bytes(b"\0" * size)
+    return str(path)
+
+class TestDiskCap:
+    """Test cases for the video directory disk usage cap"""
+
+    def test_drops_oldest_first(self, tmp_path):
+        """Test that the oldest videos are dropped until the directory fits"""
+        for index, name in enumerate(["old", "middle", "new"]):
+            write_video(tmp_path / f"{name}.webm", 100)
+            os.utime(tmp_path / f"{name}.webm", (index, index))
+
+        assert enforce_disk_cap(tmp_path, 200) == 1
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["middle.webm", "new.webm"]
+
+    def test_under_cap(self, tmp_path):
+        """Test that nothing is dropped under the cap"""
+        write_video(tmp_path / "a.webm", 100)
+
+        assert enforce_disk_cap(tmp_path, 1000) == 0
+
+class TestVideoStats:
+    """Test cases for the video counters shipped between workers"""
+
+    def test_drain_and_merge(self):
+        """Test that drained counters reset and add up on the controller"""
+        worker = VideoStats()
+        worker.tests = 2
+        worker.overhead_seconds = 0.5
+        controller = VideoStats()
+
+        controller.merge(worker.drain())
+
+        assert worker.drain() == {}
+        assert controller.tests == 2
+        assert controller.overhead_ms == pytest.approx(250)
+
+    def test_throughput(self):
+        """Test encode throughput in MB per second"""
+        stats = VideoStats()
+        stats.encoded_bytes = 4 * 1024 * 1024
+        stats.encode_seconds = 2
+
+        assert stats.throughput_mb_s == pytest.approx(2)
+
+class TestVideoRecorder:
+    """Test cases for selective video retention"""
+
+    def test_transcode_without_ffmpeg(self, tmp_path, monkeypatch):
+        """Test that the raw recording is kept when ffmpeg is not available"""
+        monkeypatch.setattr("shutil.which", lambda name: None)
+        source = write_video(tmp_path / "raw.webm", 10)
+
+        size, _ = transcode(source, str(tmp_path / "kept.webm"))
+
+        assert size == 10
+        assert (tmp_path / "kept.webm").exists()
+        assert not (tmp_path / "raw.webm").exists()
+
+    def test_passing_video_deleted(self, tmp_path):
+        """Test that a passing test's video is deleted right away"""
+        recorder = VideoRecorder(str(tmp_path / "videos"))
+        video = FakeVideo(write_video(tmp_path / "raw.webm", 10))
+
+        recorder.collect([video], "tests/test_login.py::TestLogin::test_ok", failed=False)
+        recorder.shutdown()
+
+        assert video.deleted
+        assert recorder.stats.deleted == 1
+        assert not (tmp_path / "videos").exists()
+
+    def test_failing_video_kept(self, tmp_path):
+        """Test that a failing test's video is transcoded into the video directory"""
+        recorder = VideoRecorder(str(tmp_path / "videos"))
+        video = FakeVideo(write_video(tmp_path / "raw.webm", 10))
+
+        recorder.collect([video], "tests/test_login.py::TestLogin::test_bad", failed=True)
+        recorder.shutdown()
+
+        assert not video.deleted
+        assert recorder.stats.encoded == 1
+        assert [path.name for path in (tmp_path / "videos").iterdir()] == [
+            "tests-test_login.py-TestLogin-test_bad-0.webm"
+        ]
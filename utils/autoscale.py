@@ -0,0 +1,290 @@
+"""Adaptive pytest-xdist worker count based on measured browser memory and CPU"""
+import math
+import os
+import time
+from collections import deque
+from typing import List, Optional, Tuple
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from utils.process_stats import memory_info_mb, process_tree_cpu_seconds, process_tree_rss_mb
+
+# Rough cost of one worker with its browser, used before anything is measured
+DEFAULT_WORKER_RSS_MB = 350
+# Workers that run the first tests while the cost per worker is measured
+PROBE_WORKERS = 2
+
+
+def worker_ceiling() -> int:
+    """Get the largest worker pool this host could possibly run"""
+    cpus = os.cpu_count() or 1
+    available = memory_info_mb().get("MemAvailable")
+    if available is None:
+        return cpus
+    return max(1, min(cpus, int(available // DEFAULT_WORKER_RSS_MB)))
+
+
+class WorkerAutoscaler:
+    """
+    Decides how many workers should be pulling tests at a time.
+
+    Samples of per-worker RSS and CPU cores are collected from the first
+    tests. Once ``warmup_tests`` samples are in, the target is set to what
+    the host can fit by CPU and by memory, and every ``interval`` tests it
+    is moved down under memory or CPU pressure, or up when there is headroom.
+    """
+
+    def __init__(self, max_workers: int, cpu_count: int, memory_reserve_mb: float,
+                 warmup_tests: int = 4, interval: int = 10):
+        self.max_workers = max_workers
+        self.cpu_count = cpu_count
+        self.memory_reserve_mb = memory_reserve_mb
+        self.warmup_tests = warmup_tests
+        self.interval = interval
+        self.target = min(PROBE_WORKERS, max_workers)
+        self.calibrated = False
+        self.samples = deque(maxlen=50)
+        self.decisions: List[Tuple[int, int, str]] = []
+        self._last_decision_at = 0
+
+    def record(self, rss_mb: float, cpu_cores: float):
+        """Add a sample of one worker's memory and CPU use"""
+        self.samples.append((rss_mb, cpu_cores))
+
+    def per_worker(self) -> Tuple[float, float]:
+        """Get the mean RSS (MB) and CPU cores of one worker"""
+        rss = sum(sample[0] for sample in self.samples) / len(self.samples)
+        cpu = sum(sample[1] for sample in self.samples) / len(self.samples)
+        return max(rss, 1.0), max(cpu, 0.05)
+
+    def capacity(self, available_mb: float, parked_mb: float = 0.0) -> int:
+        """Get how many workers fit on the host by CPU and by memory"""
+        rss, cpu = self.per_worker()
+        by_cpu = math.floor(self.cpu_count / cpu)
+        # Memory held by the running workers comes back if they are replaced, and
+        # parked workers already hold part of what they need once they pull again
+        usable_mb = available_mb + self.target * rss + parked_mb - self.memory_reserve_mb
+        by_memory = math.floor(usable_mb / rss)
+        return max(1, min(by_cpu, by_memory, self.max_workers))
+
+    def decide(self, completed: int, available_mb: float, load: float,
+               parked_mb: float = 0.0) -> Optional[str]:
+        """
+        Update the target after a finished test, return the reason if it changed.
+
+        parked_mb is the memory still held by live workers outside the target.
+        """
+        if len(self.samples) < self.warmup_tests:
+            return None
+        if self.calibrated and completed - self._last_decision_at < self.interval:
+            return None
+        self._last_decision_at = completed
+
+        capacity = self.capacity(available_mb, parked_mb)
+        rss, cpu = self.per_worker()
+        if not self.calibrated:
+            self.calibrated = True
+            target = capacity
+            reason = f"calibrated at {rss:.0f} MB and {cpu:.2f} cores per worker"
+        elif available_mb < self.memory_reserve_mb:
+            target = self.target - 1
+            reason = f"memory pressure, {available_mb:.0f} MB available"
+        elif load > self.cpu_count * 1.1:
+            target = self.target - 1
+            reason = f"CPU saturated, load {load:.1f}"
+        elif self.target < capacity and load < self.cpu_count * 0.75:
+            target = self.target + 1
+            reason = f"headroom, load {load:.1f} and {available_mb:.0f} MB available"
+        else:
+            return None
+
+        target = max(1, min(target, self.max_workers))
+        if target == self.target:
+            return None
+        self.decisions.append((completed, target, reason))
+        self.target = target
+        return reason
+
+
+class AutoscaleScheduling(LoadScheduling):
+    """
+    Pull based scheduling with a variable number of active workers.
+
+    Every active worker holds at most two queued tests and gets the next one
+    from the shared queue as it finishes. Workers that never ran a test are
+    parked beyond the target: they hold no browser and no tests, and start
+    pulling when the target grows. A worker that ran tests and falls outside
+    a lowered target is shut down instead, which frees its browser and runs
+    the tests it holds (a parked xdist worker would keep its last queued
+    test until the end of the run, as it only runs a test once it knows the
+    next one).
+    """
+
+    def __init__(self, config, log=None, target: int = 1):
+        super().__init__(config, log)
+        self.target = target
+        self.active = set()
+        self.started = set()
+
+    def set_target(self, target: int):
+        """Change the number of workers that pull tests"""
+        self.target = target
+        if self.collection is not None:
+            self._rebalance()
+
+    def live_nodes(self) -> list:
+        """Get the workers that are not shutting down, in gateway order"""
+        return sorted(
+            (node for node in self.nodes if not node.shutting_down),
+            key=lambda node: node.gateway.id
+        )
+
+    def parked_nodes(self) -> list:
+        """Get the live workers outside the target"""
+        return [node for node in self.live_nodes() if node not in self.active]
+
+    def _rebalance(self):
+        """Keep ``target`` live workers pulling, preferring those with a warm browser, and refill their queues"""
+        nodes = self.live_nodes()
+        ordered = [node for node in nodes if node in self.started]
+        ordered += [node for node in nodes if node not in self.started]
+        self.active = set(ordered[:self.target])
+        for node in ordered[self.target:]:
+            if node in self.started:
+                node.shutdown()
+        for node in nodes:
+            self.check_schedule(node)
+
+    def _send_tests(self, node, num):
+        self.started.add(node)
+        super()._send_tests(node, num)
+
+    def check_schedule(self, node, duration=0):
+        """Top up an active worker's queue, shut all workers down once it is empty"""
+        if node.shutting_down:
+            return
+        if not self.pending:
+            for other in self.nodes:
+                if not other.shutting_down:
+                    other.shutdown()
+            return
+        if node in self.active:
+            node_pending = self.node2pending[node]
+            if len(node_pending) < 2:
+                self._send_tests(node, 2 - len(node_pending))
+
+    def remove_node(self, node):
+        """Remove a worker and hand its share of the pool to a parked one"""
+        self.active.discard(node)
+        crashitem = super().remove_node(node)
+        if self.collection is not None and self.pending:
+            self._rebalance()
+        return crashitem
+
+    def schedule(self):
+        """Build the shared queue and start feeding the active workers"""
+        assert self.collection_is_completed
+        if self.collection is None:
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = list(self.node2collection.values())[0]
+            self.pending[:] = range(len(self.collection))
+        if not self.collection:
+            return
+        self._rebalance()
+
+
+class WorkerSampler:
+    """Worker side: attaches the worker's RSS and CPU use to every test report"""
+
+    def __init__(self):
+        self._last = (time.monotonic(), self._cpu_seconds())
+
+    @staticmethod
+    def _cpu_seconds() -> float:
+        return time.process_time() + (process_tree_cpu_seconds() or 0.0)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "call":
+            return
+        now, cpu = time.monotonic(), self._cpu_seconds()
+        last_time, last_cpu = self._last
+        self._last = (now, cpu)
+        rss = process_tree_rss_mb()
+        if rss is None:
+            return
+        report.user_properties.append(("worker_rss_mb", rss))
+        report.user_properties.append(("worker_cpu_cores", (cpu - last_cpu) / max(now - last_time, 1e-3)))
+
+
+class XdistAutoscale:
+    """Controller side: owns the autoscaler and applies its decisions to the scheduler"""
+
+    def __init__(self, config):
+        self.config = config
+        memory = memory_info_mb()
+        self.autoscaler = WorkerAutoscaler(
+            max_workers=config.getoption("numprocesses"),
+            cpu_count=os.cpu_count() or 1,
+            memory_reserve_mb=max(512.0, memory.get("MemTotal", 0) * 0.1),
+            warmup_tests=config.getoption("--autoscale-warmup"),
+            interval=config.getoption("--autoscale-interval"),
+        )
+        self.scheduler = None
+        # Last RSS reported by each worker, by gateway id
+        self.worker_rss = {}
+        self.completed = 0
+        self.started = time.monotonic()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        self.scheduler = AutoscaleScheduling(config, log, target=self.autoscaler.target)
+        self._log(f"starting with {self.autoscaler.target} of {self.autoscaler.max_workers} workers")
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call":
+            return
+        self.completed += 1
+        properties = dict(report.user_properties)
+        if "worker_rss_mb" in properties:
+            self.autoscaler.record(properties["worker_rss_mb"], properties["worker_cpu_cores"])
+            node = getattr(report, "node", None)
+            if node is not None:
+                self.worker_rss[node.gateway.id] = properties["worker_rss_mb"]
+        if self.scheduler is None:
+            return
+
+        available = memory_info_mb().get("MemAvailable", float("inf"))
+        load = os.getloadavg()[0] if hasattr(os, "getloadavg") else 0.0
+        parked_mb = sum(self.worker_rss.get(node.gateway.id, 0.0) for node in self.scheduler.parked_nodes())
+        reason = self.autoscaler.decide(self.completed, available, load, parked_mb)
+        if reason:
+            self.scheduler.set_target(self.autoscaler.target)
+            # Workers shut down by a lower target do not come back
+            self.autoscaler.max_workers = len(self.scheduler.live_nodes())
+            rate = self.completed / (time.monotonic() - self.started)
+            self._log(f"{self.autoscaler.target} workers after {self.completed} tests ({reason}), {rate:.2f} tests/s")
+
+    def _log(self, message: str):
+        reporter = self.config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(f"[autoscale] {message}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.completed:
+            return
+        terminalreporter.section("xdist autoscale")
+        for completed, target, reason in self.autoscaler.decisions:
+            terminalreporter.write_line(f"after {completed:>4} tests -> {target} workers: {reason}")
+        elapsed = time.monotonic() - self.started
+        if self.completed and elapsed > 0:
+            terminalreporter.write_line(
+                f"{self.completed} tests in {elapsed:.1f}s, {self.completed / elapsed:.2f} tests/s, "
+                f"final target {self.autoscaler.target} workers"
+            )
@@ -0,0 +1,223 @@
+"""Streaming catalog reads, single-pass order checks and exact price parsing"""
+import locale
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from playwright.sync_api import Page, expect
+
+DEFAULT_CHUNK_SIZE = 500
+
+DEFAULT_LOCALE = "en_US"
+
+# Elements of a static list, queried once and kept in the page behind a handle
+LIST_SCRIPT = "(selector) => Array.from(document.querySelectorAll(selector))"
+# Text of items [start, end) of that list, so only one chunk crosses the protocol
+CHUNK_SCRIPT = """
+(elements, [start, end]) => elements.slice(start, end).map((element) => element.textContent)
+"""
+
+# Joins a chunk of price texts so it is cleaned by one regex pass
+CHUNK_SEPARATOR = "\x1f"
+
+# Rows of a virtualized list rendered after the last seen key, then scroll one viewport on
+# and report whether the scroll moved at all
+VIRTUAL_CHUNK_SCRIPT = """
+async ([container, item, keyAttribute, after]) => {
+    await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    const root = document.querySelector(container);
+    const rows = Array.from(root.querySelectorAll(item))
+        .map((element) => [Number(element.getAttribute(keyAttribute)), element.textContent])
+        .filter(([key]) => key > after)
+        .sort((a, b) => a[0] - b[0]);
+    const atEnd = root.scrollTop + root.clientHeight >= root.scrollHeight - 1;
+    const before = root.scrollTop;
+    root.scrollTop += root.clientHeight;
+    return { rows, atEnd, moved: root.scrollTop > before };
+}
+"""
+
+
+class PriceFormat:
+    """
+    Locale rules for turning price text into an exact Decimal.
+
+    Everything except digits, the minus sign and the decimal point is
+    dropped (currency symbols, grouping separators, spaces), then the
+    decimal point is normalised to ".".
+    """
+
+    def __init__(self, decimal_point: str = "."):
+        self.decimal_point = decimal_point
+        self._noise = re.compile(rf"[^0-9\-{re.escape(decimal_point)}{CHUNK_SEPARATOR}]")
+
+    @classmethod
+    def from_locale(cls, locale_name: Optional[str] = None) -> "PriceFormat":
+        """Build the format of a system locale, or of the process locale (LC_NUMERIC)"""
+        if locale_name is None:
+            return cls(locale.localeconv()["decimal_point"] or ".")
+        current = locale.setlocale(locale.LC_NUMERIC)
+        try:
+            locale.setlocale(locale.LC_NUMERIC, locale_name)
+        except locale.Error:
+            raise ValueError(f"Unknown locale: {locale_name!r}") from None
+        try:
+            return cls(locale.localeconv()["decimal_point"] or ".")
+        finally:
+            locale.setlocale(locale.LC_NUMERIC, current)
+
+    def _clean(self, text: str) -> str:
+        cleaned = self._noise.sub("", text)
+        if self.decimal_point != ".":
+            cleaned = cleaned.replace(self.decimal_point, ".")
+        return cleaned
+
+    def _decimal(self, cleaned: str, text: str) -> Decimal:
+        try:
+            return Decimal(cleaned)
+        except InvalidOperation:
+            raise ValueError(f"Not a price: {text!r}") from None
+
+    def parse(self, text: str) -> Decimal:
+        """Parse one price, e.g. '$1,299.99' or '1.299,99 €'"""
+        return self._decimal(self._clean(text.replace(CHUNK_SEPARATOR, "")), text)
+
+    def parse_many(self, texts: Iterable[str]) -> List[Decimal]:
+        """
+        Parse a chunk of prices.
+
+        The chunk is joined and cleaned with a single regex substitution
+        instead of one per price; only the Decimal conversion is per item.
+        """
+        texts = [text.replace(CHUNK_SEPARATOR, "") for text in texts]
+        if not texts:
+            return []
+        cleaned = self._clean(CHUNK_SEPARATOR.join(texts)).split(CHUNK_SEPARATOR)
+        return [self._decimal(number, text) for number, text in zip(cleaned, texts)]
+
+
+PRICE_FORMATS = {
+    "en_US": PriceFormat("."),
+    "en_GB": PriceFormat("."),
+    "de_CH": PriceFormat("."),
+    "de_DE": PriceFormat(","),
+    "fr_FR": PriceFormat(","),
+}
+
+
+def price_format(locale_name: Optional[str] = None) -> PriceFormat:
+    """Get the price format of a locale, from PRICE_FORMATS or the system locale database"""
+    if locale_name in PRICE_FORMATS:
+        return PRICE_FORMATS[locale_name]
+    return PriceFormat.from_locale(locale_name)
+
+
+def iter_chunks(page: Page, selector: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    Stream the text of a static list in chunks of chunk_size items.
+
+    The list is queried once and each chunk is sliced from the elements
+    kept in the page, so a read is linear in the size of the list.
+    """
+    elements = page.evaluate_handle(LIST_SCRIPT, selector)
+    try:
+        start = 0
+        while True:
+            chunk = elements.evaluate(CHUNK_SCRIPT, [start, start + chunk_size])
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                return
+            start += chunk_size
+    finally:
+        elements.dispose()
+
+
+def iter_virtualized_chunks(page: Page, container: str, item: str,
+                            key_attribute: str = "aria-rowindex") -> Iterator[List[str]]:
+    """
+    Stream the text of a virtualized list by scrolling it one viewport per chunk.
+
+    Stops at the end of the list, or when a scroll shows no new rows and
+    does not move (a collapsed container, or one that cannot scroll further).
+    """
+    after = float("-inf")
+    while True:
+        result = page.evaluate(VIRTUAL_CHUNK_SCRIPT, [container, item, key_attribute, after])
+        rows = result["rows"]
+        if rows:
+            after = rows[-1][0]
+            yield [text for _, text in rows]
+        elif result["atEnd"] or not result["moved"]:
+            return
+
+
+def iter_paginated_chunks(page: Page, selector: str, next_selector: str,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[str]]:
+    """Stream the text of a paginated list, following the next button until it is gone or disabled"""
+    while True:
+        yield from iter_chunks(page, selector, chunk_size)
+        next_button = page.locator(next_selector)
+        if next_button.count() == 0 or next_button.is_disabled():
+            return
+        first_item = page.locator(selector).first
+        first_text = first_item.text_content()
+        next_button.click()
+        expect(first_item).not_to_have_text(first_text)
+
+
+def flatten(chunks: Iterable[List[Any]]) -> Iterator[Any]:
+    """Turn a stream of chunks into a stream of items"""
+    for chunk in chunks:
+        yield from chunk
+
+
+def iter_prices(chunks: Iterable[List[str]], locale_name: str = DEFAULT_LOCALE) -> Iterator[Decimal]:
+    """Parse a stream of price text chunks into Decimals"""
+    prices = price_format(locale_name)
+    for chunk in chunks:
+        yield from prices.parse_many(chunk)
+
+
+def find_order_violation(items: Iterable[Any], reverse: bool = False,
+                         key: Optional[Callable[[Any], Any]] = None) -> Optional[Tuple[int, Any, Any]]:
+    """
+    Check in a single pass that items are in ascending (or descending) order.
+
+    Only the previous item is kept, so memory does not grow with the
+    catalog. Returns (index, previous, item) of the first out of order
+    item, or None if the items are sorted.
+    """
+    previous = previous_key = None
+    for index, item in enumerate(items):
+        item_key = key(item) if key else item
+        if index and (item_key > previous_key if reverse else item_key < previous_key):
+            return index, previous, item
+        previous, previous_key = item, item_key
+    return None
+
+
+def assert_sorted(items: Iterable[Any], reverse: bool = False,
+                  key: Optional[Callable[[Any], Any]] = None, what: str = "Items", min_count: int = 1) -> int:
+    """
+    Assert that items are sorted, naming the first out of order pair.
+
+    At least min_count items must be read, so an empty stream (a broken
+    locator, a list that never rendered) does not pass as sorted. Returns
+    the number of items checked.
+    """
+    count = 0
+
+    def counted():
+        nonlocal count
+        for count, item in enumerate(items, 1):
+            yield item
+
+    violation = find_order_violation(counted(), reverse=reverse, key=key)
+    if violation:
+        index, previous, item = violation
+        order = "descending" if reverse else "ascending"
+        raise AssertionError(f"{what} are not in {order} order at index {index}: {previous!r} then {item!r}")
+    if count < min_count:
+        raise AssertionError(f"Expected at least {min_count} {what.lower()}, read {count}")
+    return count
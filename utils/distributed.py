@@ -0,0 +1,508 @@
+"""Coordinator/agent test distribution over TCP or Unix sockets"""
+import json
+import os
+import select
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pytest
+from _pytest.reports import TestReport
+
+# Seconds between agent heartbeats, and without any message before an agent is lost
+HEARTBEAT_INTERVAL = 2.0
+HEARTBEAT_TIMEOUT = 15.0
+# Seconds the coordinator waits for an agent while work is left
+AGENT_WAIT = 60.0
+# Seconds a local agent gets to finish its session once stopped, and to exit once terminated
+AGENT_EXIT_TIMEOUT = 30.0
+AGENT_TERMINATE_TIMEOUT = 5.0
+# Largest batch handed out at once; later batches shrink as the queue drains
+MAX_BATCH = 16
+# Tests an agent holds before asking for more
+PREFETCH = 2
+
+
+def parse_address(address: str) -> Tuple[int, object]:
+    """Turn 'host:port' or 'unix:/path' into a socket family and address"""
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise pytest.UsageError(f"Expected host:port or unix:/path, got {address!r}")
+    return socket.AF_INET, (host, int(port))
+
+
+def format_address(family: int, address) -> str:
+    """Inverse of parse_address"""
+    if family == socket.AF_UNIX:
+        return f"unix:{address}"
+    return f"{address[0]}:{address[1]}"
+
+
+def agent_args(args: List[str]) -> List[str]:
+    """Command line of a local agent: the coordinator's own, without the coordinator options"""
+    result = []
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg in ("--coordinator", "--local-agents"):
+            skip = True
+        elif not arg.startswith(("--coordinator=", "--local-agents=")):
+            result.append(arg)
+    return result
+
+
+class Channel:
+    """Newline-delimited JSON messages over a blocking socket"""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.buffer = b""
+        self.lock = threading.Lock()
+
+    def send(self, message: dict):
+        data = (json.dumps(message) + "\n").encode()
+        with self.lock:
+            self.sock.sendall(data)
+
+    def fill(self):
+        """Read what the socket has, raising ConnectionError once it is closed"""
+        data = self.sock.recv(65536)
+        if not data:
+            raise ConnectionError("connection closed")
+        self.buffer += data
+
+    def messages(self) -> List[dict]:
+        """Complete messages read so far"""
+        *lines, self.buffer = self.buffer.split(b"\n")
+        return [json.loads(line) for line in lines if line]
+
+    def receive(self, timeout: Optional[float] = None) -> List[dict]:
+        """Wait up to timeout (None for ever) for at least one message"""
+        messages = self.messages()
+        while not messages:
+            ready, _, _ = select.select([self.sock], [], [], timeout)
+            if not ready:
+                return []
+            self.fill()
+            messages = self.messages()
+        return messages
+
+    def close(self):
+        self.sock.close()
+
+
+class Dispatcher:
+    """
+    Bookkeeping of the test queue and of the tests each agent holds.
+
+    Agents pull batches; batches shrink as the queue drains. Once the
+    queue is empty, an idle agent steals half of the not yet started tests
+    of the busiest agent. When an agent is lost, tests it had not started
+    go back to the front of the queue and the one it was running is
+    reported as crashed.
+    """
+
+    def __init__(self, nodeids: List[str], max_batch: int = MAX_BATCH):
+        self.queue: Deque[str] = deque(nodeids)
+        self.max_batch = max_batch
+        self.assigned: Dict[str, List[str]] = {}
+        self.started = set()
+        self.waiting: List[str] = []
+        self.stealing: Dict[str, str] = {}
+
+    @property
+    def done(self) -> bool:
+        return not self.queue and not any(self.assigned.values())
+
+    def add_agent(self, agent: str):
+        self.assigned.setdefault(agent, [])
+
+    def batch_size(self) -> int:
+        return max(1, min(self.max_batch, len(self.queue) // (2 * max(1, len(self.assigned)))))
+
+    def request(self, agent: str) -> List[str]:
+        """Hand out a batch, or park the agent until work turns up"""
+        if not self.queue:
+            if agent not in self.waiting:
+                self.waiting.append(agent)
+            return []
+        if agent in self.waiting:
+            self.waiting.remove(agent)
+        batch = [self.queue.popleft() for _ in range(self.batch_size())]
+        self.assigned[agent].extend(batch)
+        return batch
+
+    def serve_waiting(self) -> List[Tuple[str, List[str]]]:
+        """Batches for parked agents now that the queue has work"""
+        served = []
+        while self.waiting and self.queue:
+            agent = self.waiting[0]
+            served.append((agent, self.request(agent)))
+        return served
+
+    def unstarted(self, agent: str) -> List[str]:
+        return [nodeid for nodeid in self.assigned.get(agent, []) if nodeid not in self.started]
+
+    def steal(self, thief: str) -> Optional[Tuple[str, int]]:
+        """Pick the agent to take tests from for an idle one, as (victim, count)"""
+        candidates = [
+            (len(self.unstarted(agent)), agent) for agent in self.assigned
+            if agent != thief and agent not in self.stealing
+        ]
+        # The victim keeps at least the test it has already lined up next
+        candidates = [(count, agent) for count, agent in candidates if count >= 2]
+        if not candidates:
+            return None
+        count, victim = max(candidates)
+        self.stealing[victim] = thief
+        return victim, count // 2
+
+    def stolen(self, victim: str, nodeids: List[str]) -> List[Tuple[str, List[str]]]:
+        """Hand the tests given up by a victim to the thief, or queue them if it is gone"""
+        thief = self.stealing.pop(victim, None)
+        for nodeid in nodeids:
+            self.assigned[victim].remove(nodeid)
+        if nodeids and thief in self.waiting:
+            self.waiting.remove(thief)
+            self.assigned[thief].extend(nodeids)
+            return [(thief, nodeids)]
+        self.queue.extendleft(reversed(nodeids))
+        return []
+
+    def start(self, nodeid: str):
+        self.started.add(nodeid)
+
+    def complete(self, agent: str, nodeid: str):
+        if nodeid in self.assigned.get(agent, []):
+            self.assigned[agent].remove(nodeid)
+        self.started.discard(nodeid)
+
+    def remove_agent(self, agent: str) -> Tuple[List[str], List[str]]:
+        """Forget a lost agent, returning (requeued, crashed) tests"""
+        held = self.assigned.pop(agent, [])
+        crashed = [nodeid for nodeid in held if nodeid in self.started]
+        requeued = [nodeid for nodeid in held if nodeid not in self.started]
+        self.queue.extendleft(reversed(requeued))
+        self.started.difference_update(crashed)
+        if agent in self.waiting:
+            self.waiting.remove(agent)
+        self.stealing.pop(agent, None)
+        return requeued, crashed
+
+
+class AgentConnection:
+    """Coordinator side state of one connected agent"""
+
+    def __init__(self, channel: Channel):
+        self.channel = channel
+        self.name: Optional[str] = None
+        self.last_seen = time.monotonic()
+
+
+class Coordinator:
+    """
+    Serves collected test node ids to agents and reports their results.
+
+    Registered with --coordinator. Collection runs as usual, then instead
+    of running tests the coordinator listens for agents and replays the
+    reports they stream through its own hooks, so terminal output,
+    junit-xml and HTML reports cover the whole run.
+    """
+
+    def __init__(self, config, address: str, local_agents: int = 0):
+        self.config = config
+        self.address = address
+        self.local_agents = local_agents
+        self.processes: List[subprocess.Popen] = []
+        self.connections: Dict[socket.socket, AgentConnection] = {}
+        self.dispatcher: Optional[Dispatcher] = None
+        self.items = {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.config.option.collectonly:
+            return None
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            raise session.Interrupted(f"{session.testsfailed} error(s) during collection")
+
+        if not session.items:
+            return None
+
+        self.items = {item.nodeid: item for item in session.items}
+        self.dispatcher = Dispatcher(list(self.items))
+        family, address = parse_address(self.address)
+        server = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_UNIX and os.path.exists(address):
+            os.unlink(address)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(address)
+        server.listen()
+        listening = format_address(family, server.getsockname())
+        self._log(f"listening on {listening} with {len(self.items)} test(s)")
+        self._spawn_agents(listening)
+        try:
+            self._serve(session, server)
+        finally:
+            for connection in list(self.connections.values()):
+                self._send(connection, {"type": "stop"})
+                connection.channel.close()
+            server.close()
+            if family == socket.AF_UNIX:
+                os.unlink(address)
+            for process in self.processes:
+                self._reap(process)
+        return True
+
+    def _reap(self, process: subprocess.Popen):
+        """Wait for a local agent to exit, terminating (then killing) one that hangs"""
+        try:
+            process.wait(timeout=AGENT_EXIT_TIMEOUT)
+            return
+        except subprocess.TimeoutExpired:
+            self._log(f"local agent {process.pid} did not exit, terminating it")
+        process.terminate()
+        try:
+            process.wait(timeout=AGENT_TERMINATE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _spawn_agents(self, address: str):
+        args = agent_args(list(self.config.invocation_params.args))
+        for _ in range(self.local_agents):
+            self.processes.append(subprocess.Popen(
+                [sys.executable, "-m", "pytest", *args, "--agent", address],
+                cwd=self.config.invocation_params.dir,
+                stdout=subprocess.DEVNULL,
+            ))
+
+    def _serve(self, session, server: socket.socket):
+        idle_since = time.monotonic()
+        while not self.dispatcher.done:
+            if session.shouldstop or session.shouldfail:
+                return
+            sockets = [server, *self.connections]
+            readable, _, _ = select.select(sockets, [], [], HEARTBEAT_INTERVAL)
+            for sock in readable:
+                if sock is server:
+                    client, _ = server.accept()
+                    self.connections[client] = AgentConnection(Channel(client))
+                    continue
+                connection = self.connections.get(sock)
+                if connection is None:
+                    continue
+                try:
+                    connection.channel.fill()
+                except OSError as error:
+                    self._lose(connection, str(error))
+                    continue
+                connection.last_seen = time.monotonic()
+                for message in connection.channel.messages():
+                    self._handle(connection, message)
+                self._serve_waiting()
+
+            now = time.monotonic()
+            for connection in list(self.connections.values()):
+                if now - connection.last_seen > HEARTBEAT_TIMEOUT:
+                    self._lose(connection, f"no heartbeat for {HEARTBEAT_TIMEOUT:.0f}s")
+            if self.connections:
+                idle_since = now
+            elif now - idle_since > AGENT_WAIT:
+                raise session.Interrupted(f"no agent connected for {AGENT_WAIT:.0f}s")
+
+    def _handle(self, connection: AgentConnection, message: dict):
+        kind = message["type"]
+        if kind == "hello":
+            connection.name = message["agent"]
+            self.dispatcher.add_agent(connection.name)
+            self._log(f"agent {connection.name} joined")
+        elif kind == "want":
+            self._hand_out(connection)
+        elif kind == "report":
+            self._report(connection, message["report"])
+        elif kind == "stolen":
+            thief = self.dispatcher.stealing.get(connection.name)
+            for agent, batch in self.dispatcher.stolen(connection.name, message["nodeids"]):
+                self._send_tests(agent, batch)
+            if not message["nodeids"]:
+                # The victim started its tests meanwhile
+                self._release(thief)
+        elif kind == "unknown":
+            self._fail(message["nodeid"], f"not collected on agent {connection.name}")
+            self.dispatcher.complete(connection.name, message["nodeid"])
+
+    def _hand_out(self, connection: AgentConnection):
+        batch = self.dispatcher.request(connection.name)
+        if batch:
+            self._send(connection, {"type": "tests", "nodeids": batch})
+            return
+        steal = self.dispatcher.steal(connection.name)
+        if steal is None:
+            # Nothing to give now; the agent stays parked for requeued tests
+            self._send(connection, {"type": "tests", "nodeids": []})
+            return
+        victim, count = steal
+        for other in self.connections.values():
+            if other.name == victim:
+                self._send(other, {"type": "steal", "count": count})
+
+    def _serve_waiting(self):
+        for agent, batch in self.dispatcher.serve_waiting():
+            self._send_tests(agent, batch)
+
+    def _send_tests(self, agent: str, batch: List[str]):
+        for connection in self.connections.values():
+            if connection.name == agent:
+                self._send(connection, {"type": "tests", "nodeids": batch})
+
+    def _release(self, thief: Optional[str]):
+        """Let a thief whose steal came to nothing run the tests it holds"""
+        if thief in self.dispatcher.waiting:
+            self._send_tests(thief, [])
+
+    def _report(self, connection: AgentConnection, data: dict):
+        hook = self.config.hook
+        report = hook.pytest_report_from_serializable(config=self.config, data=data)
+        if report.when == "setup":
+            self.dispatcher.start(report.nodeid)
+            hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+        hook.pytest_runtest_logreport(report=report)
+        if report.when == "teardown":
+            self.dispatcher.complete(connection.name, report.nodeid)
+            hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+
+    def _fail(self, nodeid: str, reason: str):
+        """Report a test that no agent could finish as failed"""
+        location = self.items[nodeid].location
+        report = TestReport(nodeid, location, {}, "failed", reason, "call")
+        hook = self.config.hook
+        hook.pytest_runtest_logstart(nodeid=nodeid, location=location)
+        hook.pytest_runtest_logreport(report=report)
+        hook.pytest_runtest_logfinish(nodeid=nodeid, location=location)
+
+    def _lose(self, connection: AgentConnection, reason: str):
+        del self.connections[connection.channel.sock]
+        connection.channel.close()
+        if connection.name is None:
+            return
+        thief = self.dispatcher.stealing.get(connection.name)
+        requeued, crashed = self.dispatcher.remove_agent(connection.name)
+        self._log(f"agent {connection.name} lost ({reason}), {len(requeued)} test(s) requeued")
+        for nodeid in crashed:
+            self._fail(nodeid, f"agent {connection.name} was lost while running this test ({reason})")
+        self._serve_waiting()
+        self._release(thief)
+
+    def _send(self, connection: AgentConnection, message: dict):
+        try:
+            connection.channel.send(message)
+        except OSError:
+            pass  # Picked up as a lost agent on the next read
+
+    def _log(self, line: str):
+        reporter = self.config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(f"[coordinator] {line}")
+
+
+class Agent:
+    """
+    Runs the tests a coordinator hands out, in this process's own browsers.
+
+    Registered with --agent. Collection runs as usual; the agent then
+    pulls node ids, runs them with the standard runtest protocol and
+    streams every report back. A background thread sends heartbeats
+    while a test is running.
+    """
+
+    def __init__(self, config, address: str):
+        self.config = config
+        self.address = address
+        self.channel: Optional[Channel] = None
+        self.local: Deque[str] = deque()
+        self.requested = False
+        self.drained = False
+        self.stopping = False
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.config.option.collectonly:
+            return None
+        items = {item.nodeid: item for item in session.items}
+        family, address = parse_address(self.address)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.connect(address)
+        self.channel = Channel(sock)
+        self.channel.send({"type": "hello", "agent": f"{socket.gethostname()}-{os.getpid()}"})
+        stop_heartbeat = threading.Event()
+        threading.Thread(target=self._heartbeat, args=(stop_heartbeat,), daemon=True).start()
+        try:
+            self._run(items)
+        finally:
+            stop_heartbeat.set()
+            self.channel.close()
+        return True
+
+    def _run(self, items: dict):
+        while True:
+            if not (self.requested or self.stopping) and len(self.local) < PREFETCH:
+                self.channel.send({"type": "want"})
+                self.requested = True
+            if self.local and (len(self.local) > 1 or self.drained or self.stopping):
+                for message in self.channel.receive(timeout=0):
+                    self._handle(message, items)
+                nodeid = self.local.popleft()
+                nextitem = items[self.local[0]] if self.local else None
+                items[nodeid].config.hook.pytest_runtest_protocol(item=items[nodeid], nextitem=nextitem)
+                continue
+            if self.stopping:
+                return
+            for message in self.channel.receive():
+                self._handle(message, items)
+
+    def _handle(self, message: dict, items: dict):
+        kind = message["type"]
+        if kind == "tests":
+            for nodeid in message["nodeids"]:
+                if nodeid in items:
+                    self.local.append(nodeid)
+                else:
+                    self.channel.send({"type": "unknown", "nodeid": nodeid})
+            if message["nodeids"]:
+                self.requested = False
+                self.drained = False
+            else:
+                self.drained = True
+        elif kind == "steal":
+            # The first test is already lined up as the next item of the previous run
+            count = min(message["count"], len(self.local) - 1)
+            given = [self.local.pop() for _ in range(max(0, count))][::-1]
+            self.channel.send({"type": "stolen", "nodeids": given})
+        elif kind == "stop":
+            # Only the test lined up by the previous run is still run, to tear down cleanly
+            while len(self.local) > 1:
+                self.local.pop()
+            self.stopping = True
+
+    def _heartbeat(self, stop: threading.Event):
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                self.channel.send({"type": "heartbeat"})
+            except OSError:
+                return
+
+    def pytest_runtest_logreport(self, report):
+        if self.channel is None:
+            return
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        try:
+            self.channel.send({"type": "report", "report": data})
+        except OSError:
+            pass  # The coordinator stopped early (--maxfail, -x)
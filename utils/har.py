@@ -0,0 +1,141 @@
+"""HAR record/replay storage for deterministic, offline page object runs"""
+import json
+import re
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Set
+
+from playwright.sync_api import BrowserContext, Route
+
+HAR_MODES = ("off", "record", "replay")
+
+
+def har_key(name: str) -> str:
+    """Turn a test node id or flow name into a file-safe archive name"""
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", name).strip("-")
+
+
+class HarStore:
+    """
+    Directory of HAR archives shared by all tests.
+
+    Response bodies are attached as separate files named by their SHA-1, so a
+    body served to many tests (scripts, images, fonts) is stored only once.
+    Each test records its own part (``<flow>@<test>.har``); the parts of a
+    flow are merged into its archive once the session is over, so tests
+    sharing a flow archive do not overwrite each other. The whole directory
+    is packed into a deflate-compressed zip for caching.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.bundle = self.root.with_suffix(".zip")
+        # Flows that missed requests during replay, dropped at the end of the session
+        self.stale: Set[str] = set()
+
+    def path_for(self, name: str) -> Path:
+        """Get the HAR file for a test or page object flow"""
+        return self.root / f"{har_key(name)}.har"
+
+    def part_path(self, name: str, nodeid: str) -> Path:
+        """Get the HAR file one test records for a test or page object flow"""
+        return self.root / f"{har_key(name)}@{har_key(nodeid)}.har"
+
+    def has(self, name: str) -> bool:
+        """Check if an archive exists for a test or page object flow"""
+        return self.path_for(name).exists()
+
+    def discard(self, name: str):
+        """Drop an archive so that it is recorded again on the next run"""
+        self.path_for(name).unlink(missing_ok=True)
+
+    def discard_stale(self):
+        """Drop the archives of flows that missed requests during this session"""
+        for name in self.stale:
+            self.discard(name)
+        self.stale.clear()
+
+    def merge_parts(self) -> List[str]:
+        """
+        Replace the archive of every flow recorded this session by the merge
+        of its parts, returning the flow keys. Entries are taken from the
+        parts in test order, keeping the first one of each request.
+        """
+        parts: Dict[str, List[Path]] = {}
+        for path in sorted(self.root.glob("*@*.har")):
+            parts.setdefault(path.stem.split("@")[0], []).append(path)
+
+        for key, paths in parts.items():
+            merged = None
+            seen = set()
+            for path in paths:
+                har = json.loads(path.read_text())
+                entries = har["log"]["entries"]
+                if merged is None:
+                    merged = har
+                    merged["log"]["entries"] = []
+                for entry in entries:
+                    request = entry["request"]
+                    signature = (request["method"], request["url"], json.dumps(request.get("postData")))
+                    if signature not in seen:
+                        seen.add(signature)
+                        merged["log"]["entries"].append(entry)
+            (self.root / f"{key}.har").write_text(json.dumps(merged))
+            for path in paths:
+                path.unlink()
+        return list(parts)
+
+    def pack(self):
+        """Compress the store into a single zip next to the store directory"""
+        if not self.root.is_dir():
+            return
+        with zipfile.ZipFile(self.bundle, "w", zipfile.ZIP_DEFLATED) as bundle:
+            for file in sorted(self.root.iterdir()):
+                bundle.write(file, file.name)
+
+    def unpack(self):
+        """Restore the store directory from the zip if it is not present yet"""
+        if self.root.is_dir() or not self.bundle.exists():
+            return
+        self.root.mkdir(parents=True)
+        with zipfile.ZipFile(self.bundle) as bundle:
+            bundle.extractall(self.root)
+
+
+class HarSession:
+    """Routes one test's (or the shared read-only) browser context through a HAR archive in record or replay mode"""
+
+    def __init__(self, store: HarStore, name: str, nodeid: str, mode: str):
+        self.store = store
+        self.name = name
+        self.nodeid = nodeid
+        # A missing archive is recorded instead of replayed
+        self.mode = "record" if mode == "replay" and not store.has(name) else mode
+        self.misses: Set[str] = set()
+
+    def attach(self, context: BrowserContext):
+        """Start recording or replaying network traffic for a context"""
+        self.store.root.mkdir(parents=True, exist_ok=True)
+        if self.mode == "record":
+            # The part is written when the context closes and merged at the end of the session
+            context.route_from_har(
+                self.store.part_path(self.name, self.nodeid),
+                update=True, update_content="attach", update_mode="minimal"
+            )
+            return
+
+        # Registered first so it only sees requests the archive could not serve
+        context.route("**/*", self._on_miss)
+        context.route_from_har(self.store.path_for(self.name), not_found="fallback")
+
+    def _on_miss(self, route: Route):
+        """Serve a request missing from the archive from the network"""
+        self.misses.add(route.request.url)
+        route.continue_()
+
+    def finish(self):
+        """Mark a replayed archive that missed requests so it is re-recorded next run"""
+        if self.mode == "replay" and self.misses:
+            # Kept for the rest of the session so the other tests of the flow still replay
+            self.store.stale.add(self.name)
+            print(f"\nHAR archive '{self.name}' missed {len(self.misses)} request(s), re-recording next run")
@@ -0,0 +1,147 @@
+"""Self-healing locators: ranked fallback selectors with a learned on-disk cache"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from playwright.sync_api import Page
+
+
+class HealingLocator(str):
+    """
+    A CSS selector string that also carries ranked fallback strategies.
+
+    It is used anywhere a plain selector is (so ``f"{LOCATOR} > span"`` and
+    ``page.locator(LOCATOR)`` keep working), and BasePage resolves it through
+    the fallbacks when the primary selector no longer matches. Fallbacks are
+    tried in the order data-test, role + accessible name, text, extra CSS.
+    """
+
+    def __new__(cls, css: str, data_test: Optional[str] = None, role: Optional[str] = None,
+                name: Optional[str] = None, text: Optional[str] = None, alternatives: tuple = ()):
+        locator = super().__new__(cls, css)
+        fallbacks = []
+        if data_test:
+            fallbacks.append(f'[data-test="{data_test}"]')
+        if role:
+            fallbacks.append(f'role={role}[name="{name}"]' if name else f"role={role}")
+        if text:
+            fallbacks.append(f'text="{text}"')
+        fallbacks.extend(alternatives)
+        locator.fallbacks = fallbacks
+        locator.owner = css
+        return locator
+
+    def __set_name__(self, owner, name):
+        # Page object constant the locator is defined as, for the healing report
+        self.owner = f"{owner.__name__}.{name}"
+
+
+class LocatorCache:
+    """
+    Remembers which selector works for each healing locator.
+
+    Selectors confirmed to match are remembered for the process, so they
+    are only probed once. Healed selectors are also written to disk and
+    tried first by later runs, until the primary selector is fixed at the
+    source (which changes the cache key). A cached heal that no longer
+    matches is dropped and the locator is healed again.
+    """
+
+    def __init__(self):
+        self.path: Optional[Path] = None
+        self.healed: Dict[str, str] = {}
+        self.dropped: Set[str] = set()
+        self.verified: Set[str] = set()
+        self.report: Dict[str, dict] = {}
+        self.unreported: List[str] = []
+
+    def load(self, path: str):
+        """Load healed selectors learned by earlier runs"""
+        self.path = Path(path)
+        if self.path.exists():
+            self.healed.update(json.loads(self.path.read_text()))
+
+    def save(self):
+        """Write healed selectors, merged with those of other workers, without the dropped ones"""
+        if self.path is None or not (self.healed or self.dropped):
+            return
+        stored = json.loads(self.path.read_text()) if self.path.exists() else {}
+        stored.update(self.healed)
+        for primary in self.dropped:
+            stored.pop(primary, None)
+        self.path.write_text(json.dumps(stored, indent=2, sort_keys=True))
+
+    def resolve(self, page: Page, selector: str, wait: bool = True) -> str:
+        """
+        Get the selector to use for a locator.
+
+        With ``wait`` the cached heal, the primary selector and all
+        fallbacks are awaited together, so a broken primary does not run
+        into the full timeout when a fallback matches, and the best match is
+        remembered. Without it nothing is probed or learned: checks of
+        elements that may legitimately be absent (or not rendered yet) get
+        the cached heal or the primary selector.
+        """
+        if not isinstance(selector, HealingLocator) or not selector.fallbacks:
+            return selector
+        primary = str(selector)
+        cached = self.healed.get(primary)
+        if (cached or primary) in self.verified or not wait:
+            return cached or primary
+
+        candidates: List[str] = ([cached] if cached else []) + [primary]
+        candidates += [fallback for fallback in selector.fallbacks if fallback != cached]
+        combined = page.locator(candidates[0])
+        for candidate in candidates[1:]:
+            combined = combined.or_(page.locator(candidate))
+        combined.first.wait_for(state="attached")
+
+        for candidate in candidates:
+            if page.locator(candidate).count():
+                self.verified.add(candidate)
+                if candidate == primary and cached:
+                    self.drop(selector)
+                elif candidate not in (primary, cached):
+                    self.heal(selector, candidate)
+                return candidate
+        return primary
+
+    def heal(self, selector: HealingLocator, healed: str):
+        """Record a fallback that replaced a broken primary selector"""
+        primary = str(selector)
+        self.healed[primary] = healed
+        self.dropped.discard(primary)
+        self.report[primary] = {"locator": selector.owner, "healed": healed}
+        self.unreported.append(primary)
+
+    def drop(self, selector: HealingLocator):
+        """Forget a cached heal that no longer matches"""
+        primary = str(selector)
+        self.healed.pop(primary, None)
+        self.dropped.add(primary)
+        self.report[primary] = {"locator": selector.owner, "healed": None}
+        self.unreported.append(primary)
+
+    def drain(self) -> Dict[str, dict]:
+        """Get the heals and drops recorded since the last call, to ship them to the xdist controller"""
+        heals = {primary: self.report[primary] for primary in self.unreported}
+        self.unreported.clear()
+        for primary, heal in heals.items():
+            if heal["healed"] is None:
+                self.report.pop(primary, None)
+        return heals
+
+    def merge(self, heals: Dict[str, dict]):
+        """Add heals and drops recorded by another process"""
+        for primary, heal in heals.items():
+            if heal["healed"] is None:
+                self.healed.pop(primary, None)
+                self.report.pop(primary, None)
+                self.dropped.add(primary)
+            else:
+                self.healed[primary] = heal["healed"]
+                self.report[primary] = heal
+                self.dropped.discard(primary)
+
+
+locator_cache = LocatorCache()
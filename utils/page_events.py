@@ -0,0 +1,141 @@
+"""Low overhead collection of console, page and network errors per page URL"""
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from playwright.sync_api import ConsoleMessage, Error, Page, Request
+
+# Requests that hit the backend rather than static assets
+BACKEND_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+SLOW_RESPONSE_MS = 1000
+SLOWEST_REQUESTS = 10
+# Distinct error signatures kept per page, further ones are only counted
+MAX_SIGNATURES = 50
+
+
+def _url_key(url: str) -> str:
+    """Strip query and fragment so counters aggregate per page or endpoint"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def _signature(kind: str, url: str, message: str) -> str:
+    """Identify an error independently of how often it happens"""
+    first_line = message.strip().splitlines()[0] if message.strip() else ""
+    return f"{kind} {_url_key(url)} {first_line[:200]}"
+
+
+class PageEventCollector:
+    """
+    Counts error events of one page, per page URL.
+
+    Events are never stored: each one increments a counter, the first
+    MAX_SIGNATURES distinct error signatures are kept to tell known errors
+    from new ones, and only the slowest backend requests are retained.
+    """
+
+    _collectors: Dict[Page, "PageEventCollector"] = {}
+    # Turned off with --page-errors=off so pages get no event listeners at all
+    enabled = True
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.counters: Dict[str, Counter] = defaultdict(Counter)
+        self.signatures: Set[str] = set()
+        self.slowest: List[Tuple[float, str]] = []
+
+    @classmethod
+    def attach(cls, page: Page) -> Optional["PageEventCollector"]:
+        """Get the collector of a page, starting one on first use, or None when collection is off"""
+        if not cls.enabled:
+            return None
+        collector = cls._collectors.get(page)
+        if collector is None:
+            collector = cls._collectors[page] = cls(page)
+            page.on("console", collector._on_console)
+            page.on("pageerror", collector._on_page_error)
+            page.on("requestfailed", collector._on_request_failed)
+            page.on("requestfinished", collector._on_request_finished)
+            page.on("close", lambda _: cls._collectors.pop(page, None))
+        return collector
+
+    @classmethod
+    def for_page(cls, page: Page) -> Optional["PageEventCollector"]:
+        """Get the collector of a page if one was attached"""
+        return cls._collectors.get(page)
+
+    def reset(self):
+        """Forget the events counted so far"""
+        self.counters.clear()
+        self.signatures.clear()
+        self.slowest.clear()
+
+    def to_dict(self) -> dict:
+        """Get the counters in a form that can be shipped with a test report"""
+        return {
+            "counters": {url: dict(counter) for url, counter in self.counters.items()},
+            "signatures": sorted(self.signatures),
+            "slowest": [list(entry) for entry in self.slowest],
+        }
+
+    def _count(self, kind: str, message: str):
+        url = self.page.url
+        self.counters[_url_key(url)][kind] += 1
+        if len(self.signatures) < MAX_SIGNATURES:
+            self.signatures.add(_signature(kind, url, message))
+
+    def _on_console(self, message: ConsoleMessage):
+        if message.type == "error":
+            self._count("console_error", message.text)
+
+    def _on_page_error(self, error: Error):
+        self._count("page_error", error.message)
+
+    def _on_request_failed(self, request: Request):
+        self._count("request_failed", f"{request.method} {_url_key(request.url)} {request.failure}")
+
+    def _on_request_finished(self, request: Request):
+        if request.resource_type not in BACKEND_RESOURCE_TYPES:
+            return
+        duration = request.timing["responseEnd"]
+        if duration < 0:
+            return
+        if duration >= SLOW_RESPONSE_MS:
+            self.counters[_url_key(self.page.url)]["slow_response"] += 1
+        entry = (duration, f"{request.method} {_url_key(request.url)}")
+        if len(self.slowest) < SLOWEST_REQUESTS:
+            heapq.heappush(self.slowest, entry)
+        else:
+            heapq.heappushpop(self.slowest, entry)
+
+
+class PageEventSummary:
+    """Run wide totals merged from the collectors of every test, on the xdist controller"""
+
+    def __init__(self, baseline: Optional[Set[str]] = None):
+        # Known error signatures, None when no baseline exists yet
+        self.baseline = baseline
+        self.per_url: Dict[str, Counter] = defaultdict(Counter)
+        self.per_test: Dict[str, Counter] = {}
+        self.signatures: Set[str] = set()
+        self.slowest: List[Tuple[float, str]] = []
+
+    def add(self, test_id: str, events: dict):
+        """Merge the counters of one test's page, as shipped by PageEventCollector.to_dict"""
+        totals = Counter()
+        for url, counter in events["counters"].items():
+            self.per_url[url].update(counter)
+            totals.update(counter)
+        if totals:
+            self.per_test[test_id] = totals
+        self.signatures.update(events["signatures"])
+        for entry in map(tuple, events["slowest"]):
+            if len(self.slowest) < SLOWEST_REQUESTS:
+                heapq.heappush(self.slowest, entry)
+            else:
+                heapq.heappushpop(self.slowest, entry)
+
+    def slowest_requests(self) -> List[Tuple[float, str]]:
+        """Get the slowest backend requests of the run, slowest first"""
+        return sorted(self.slowest, reverse=True)
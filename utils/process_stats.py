@@ -0,0 +1,87 @@
+"""Resource usage helpers for the test process and the browsers it spawns"""
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROC = Path("/proc")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _read_stat(pid: int) -> Optional[List[str]]:
+    """Read /proc/<pid>/stat split into fields (the command name is kept as one field)"""
+    try:
+        raw = (PROC / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # The command name is wrapped in parentheses and may itself contain spaces
+    head, _, tail = raw.rpartition(")")
+    pid_part, _, comm = head.partition(" (")
+    return [pid_part, comm] + tail.split()
+
+
+def _parent_map() -> Dict[int, int]:
+    """Map every visible pid to its parent pid"""
+    parents = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        fields = _read_stat(int(entry.name))
+        if fields:
+            parents[int(entry.name)] = int(fields[3])
+    return parents
+
+
+def descendant_pids(root_pid: Optional[int] = None) -> List[int]:
+    """Get all descendants of a process (the Playwright driver and its browsers)"""
+    if not PROC.is_dir():
+        return []
+    root_pid = root_pid or os.getpid()
+    parents = _parent_map()
+    children: Dict[int, List[int]] = {}
+    for pid, ppid in parents.items():
+        children.setdefault(ppid, []).append(pid)
+
+    found, stack = [], [root_pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+
+def process_tree_rss_mb(root_pid: Optional[int] = None) -> Optional[float]:
+    """Get resident memory in MB of all descendants of a process, None if unsupported"""
+    if not PROC.is_dir():
+        return None
+    total_pages = 0
+    for pid in descendant_pids(root_pid):
+        fields = _read_stat(pid)
+        if fields:
+            total_pages += int(fields[23])
+    return total_pages * PAGE_SIZE / (1024 * 1024)
+
+
+def process_tree_cpu_seconds(root_pid: Optional[int] = None) -> Optional[float]:
+    """Get user + system CPU seconds consumed by all descendants of a process"""
+    if not PROC.is_dir():
+        return None
+    ticks = 0
+    for pid in descendant_pids(root_pid):
+        fields = _read_stat(pid)
+        if fields:
+            ticks += int(fields[13]) + int(fields[14])
+    return ticks / CLOCK_TICKS
+
+
+def memory_info_mb() -> Dict[str, float]:
+    """Get host memory counters from /proc/meminfo in MB (empty if unsupported)"""
+    try:
+        lines = (PROC / "meminfo").read_text().splitlines()
+    except OSError:
+        return {}
+    info = {}
+    for line in lines:
+        key, _, value = line.partition(":")
+        info[key] = int(value.split()[0]) / 1024
+    return info
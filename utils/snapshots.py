@@ -0,0 +1,213 @@
+"""Named app state snapshots (cookies, storage and URL) for fast test preconditions"""
+import itertools
+import json
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from playwright.sync_api import Browser, Page
+
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils.har import HarSession, HarStore
+from utils.test_data import (
+    VALID_USERNAME,
+    VALID_PASSWORD,
+    PRODUCT_BACKPACK,
+    PRODUCT_BIKE_LIGHT,
+    CHECKOUT_INFO
+)
+
+SNAPSHOT_LOGGED_IN = "logged-in"
+SNAPSHOT_CART = "cart-backpack-bike-light"
+SNAPSHOT_CHECKOUT_OVERVIEW = "checkout-overview"
+
+# sessionStorage key holding the sequence number of the last restore applied to a tab
+RESTORED_FLAG = "__snapshot_restored"
+
+# Numbers each restore, so a later restore in the same context supersedes earlier ones
+_restore_sequence = itertools.count(1)
+
+CAPTURE_SCRIPT = """
+() => ({
+    url: location.href,
+    origin: location.origin,
+    localStorage: { ...localStorage },
+    sessionStorage: Object.fromEntries(
+        Object.entries(sessionStorage).filter(([key]) => key !== "%s")
+    ),
+})
+""" % RESTORED_FLAG
+
+# Runs before the app's own scripts on every navigation, but only fills a tab once per
+# restore. Init scripts of earlier restores stay on the context and are skipped once a
+# later restore was applied to the tab.
+RESTORE_SCRIPT = """
+((snapshot) => {
+    const applied = Number(sessionStorage.getItem("%s"));
+    if (location.origin !== snapshot.origin || applied >= snapshot.sequence) return;
+    localStorage.clear();
+    Object.entries(snapshot.localStorage).forEach(([key, value]) => localStorage.setItem(key, value));
+    sessionStorage.clear();
+    Object.entries(snapshot.sessionStorage).forEach(([key, value]) => sessionStorage.setItem(key, value));
+    sessionStorage.setItem("%s", String(snapshot.sequence));
+})(%%s);
+""" % (RESTORED_FLAG, RESTORED_FLAG)
+
+
+class SnapshotDriftError(AssertionError):
+    """Raised when a restored snapshot no longer produces the expected app state"""
+
+
+class AppSnapshot:
+    """Client state of the app captured at a named point"""
+
+    def __init__(self, name: str, url: str, origin: str, cookies: List[dict],
+                 local_storage: Dict[str, str], session_storage: Dict[str, str]):
+        self.name = name
+        self.url = url
+        self.origin = origin
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+
+    @classmethod
+    def capture(cls, name: str, page: Page) -> "AppSnapshot":
+        """Capture cookies, localStorage, sessionStorage and URL of a page"""
+        state = page.evaluate(CAPTURE_SCRIPT)
+        return cls(
+            name, state["url"], state["origin"], page.context.cookies(),
+            state["localStorage"], state["sessionStorage"]
+        )
+
+    def restore(self, page: Page):
+        """Put a fresh page's context into this snapshot's state and open its URL"""
+        page.context.clear_cookies()
+        page.context.add_cookies(self.cookies)
+        page.context.add_init_script(RESTORE_SCRIPT % json.dumps({
+            "name": self.name,
+            "sequence": next(_restore_sequence),
+            "origin": self.origin,
+            "localStorage": self.local_storage,
+            "sessionStorage": self.session_storage,
+        }))
+        page.goto(self.url)
+
+
+def build_logged_in(page: Page):
+    """Log in as the standard user"""
+    login_page = LoginPage(page)
+    login_page.navigate()
+    login_page.quick_login(VALID_USERNAME, VALID_PASSWORD)
+    login_page.expect_login_successful()
+
+
+def build_cart(page: Page):
+    """Log in and add the backpack and bike light to the cart"""
+    build_logged_in(page)
+    inventory_page = InventoryPage(page)
+    inventory_page.add_items_to_cart([PRODUCT_BACKPACK, PRODUCT_BIKE_LIGHT])
+    inventory_page.expect_cart_badge_count("2")
+
+
+def build_checkout_overview(page: Page):
+    """Fill in checkout information for the cart and stop at the overview"""
+    build_cart(page)
+    InventoryPage(page).click_cart()
+    CartPage(page).proceed_to_checkout()
+    checkout_page = CheckoutPage(page)
+    checkout_page.fill_and_continue(
+        CHECKOUT_INFO["first_name"],
+        CHECKOUT_INFO["last_name"],
+        CHECKOUT_INFO["postal_code"]
+    )
+    checkout_page.expect_on_overview_page()
+
+
+def check_logged_in(page: Page):
+    """Assert the restored page is the inventory of a logged in user"""
+    LoginPage(page).expect_login_successful()
+
+
+def check_cart(page: Page):
+    """Assert the restored cart holds two items"""
+    InventoryPage(page).expect_cart_badge_count("2")
+
+
+def check_checkout_overview(page: Page):
+    """Assert the restored page is the overview of a two item order"""
+    checkout_page = CheckoutPage(page)
+    checkout_page.expect_on_overview_page()
+    assert checkout_page.get_overview_item_count() == 2
+
+
+# Snapshot name -> (builder driving the app to the state, check of the restored state)
+SNAPSHOT_BUILDERS: Dict[str, Tuple[Callable[[Page], None], Callable[[Page], None]]] = {
+    SNAPSHOT_LOGGED_IN: (build_logged_in, check_logged_in),
+    SNAPSHOT_CART: (build_cart, check_cart),
+    SNAPSHOT_CHECKOUT_OVERVIEW: (build_checkout_overview, check_checkout_overview),
+}
+
+
+class SnapshotStore:
+    """
+    Per worker, in-memory cache of app snapshots.
+
+    A snapshot is built the first time it is needed, in a throwaway
+    context, by driving the page objects to the named point. Restoring
+    it afterwards only replays cookies, storage and the URL. With a HAR
+    store the build context is routed through the ``snapshot-<name>``
+    archive, each worker recording its own part.
+    """
+
+    def __init__(self, browser: Browser, context_args: dict, har_store: Optional[HarStore] = None,
+                 har_mode: str = "off", worker: str = "main"):
+        self.browser = browser
+        self.context_args = context_args
+        self.har_store = har_store
+        self.har_mode = har_mode
+        self.worker = worker
+        self.snapshots: Dict[str, AppSnapshot] = {}
+        # Snapshots that drifted from the app, rebuilt from the network rather than the archive
+        self.drifted: Set[str] = set()
+
+    def get(self, name: str) -> AppSnapshot:
+        """Get a snapshot, building it on first use"""
+        if name not in self.snapshots:
+            builder, _ = SNAPSHOT_BUILDERS[name]
+            context = self.browser.new_context(**self.context_args)
+            har_session = None
+            if self.har_store is not None and self.har_mode != "off":
+                mode = "record" if name in self.drifted else self.har_mode
+                har_session = HarSession(self.har_store, f"snapshot-{name}", self.worker, mode)
+                har_session.attach(context)
+            try:
+                page = context.new_page()
+                builder(page)
+                self.snapshots[name] = AppSnapshot.capture(name, page)
+            finally:
+                if har_session is not None:
+                    har_session.finish()
+                # Closing the context writes the recorded part
+                context.close()
+        return self.snapshots[name]
+
+    def restore(self, page: Page, name: str):
+        """
+        Restore a page to a named snapshot and verify the app state matches.
+
+        A snapshot the app no longer accepts is rebuilt and restored once
+        more before SnapshotDriftError is raised.
+        """
+        _, check = SNAPSHOT_BUILDERS[name]
+        for attempt in range(2):
+            self.get(name).restore(page)
+            try:
+                check(page)
+                return
+            except AssertionError as error:
+                # The app no longer accepts the captured state, rebuild it
+                self.snapshots.pop(name, None)
+                self.drifted.add(name)
+                if attempt:
+                    raise SnapshotDriftError(f"Snapshot '{name}' drifted from the app: {error}") from error
@@ -0,0 +1,76 @@
+"""Pool of read-only tabs sharing one authenticated browser context"""
+from typing import List, Set
+
+from playwright.sync_api import BrowserContext, Page
+
+from pages.base_page import BasePage
+
+
+class TabPool:
+    """
+    Hands out pre-loaded tabs of one logged-in context.
+
+    Navigations are only awaited up to commit, so every idle tab keeps
+    loading in the browser while tests run on the others. A released tab
+    is sent back to the start URL and reused by a later test, unless it
+    was retired.
+    """
+
+    def __init__(self, context: BrowserContext, start_url: str, size: int = 4):
+        self.context = context
+        self.start_url = start_url
+        self.idle: List[Page] = []
+        self.retired: Set[Page] = set()
+        for _ in range(size):
+            self.idle.append(self._warm(context.new_page()))
+
+    def _warm(self, page: Page) -> Page:
+        """Start loading the start URL without waiting for the load to finish"""
+        BasePage.set_read_only(page)
+        page.goto(self.start_url, wait_until="commit")
+        return page
+
+    def acquire(self) -> Page:
+        """Get a tab that has finished loading the start URL"""
+        page = self.idle.pop(0) if self.idle else self._warm(self.context.new_page())
+        page.wait_for_load_state("load")
+        return page
+
+    def release(self, page: Page):
+        """Return a tab to the pool, reloading the start URL in the background"""
+        if page in self.retired:
+            self.discard(page)
+            return
+        self.idle.append(self._warm(page))
+
+    def retire(self, page: Page):
+        """Close a tab when it is released instead of reusing it"""
+        self.retired.add(page)
+
+    def restore(self, page: Page, state: dict):
+        """Put cookies and localStorage of the shared context back to a snapshot"""
+        self.context.clear_cookies()
+        self.context.add_cookies(state["cookies"])
+        page.goto(self.start_url, wait_until="commit")
+        origin = page.evaluate("location.origin")
+        for entry in state["origins"]:
+            if entry["origin"] == origin:
+                page.evaluate(
+                    """(items) => {
+                        localStorage.clear();
+                        items.forEach(({ name, value }) => localStorage.setItem(name, value));
+                    }""",
+                    entry["localStorage"]
+                )
+
+    def discard(self, page: Page):
+        """Close a tab whose state can no longer be trusted"""
+        self.retired.discard(page)
+        BasePage.set_read_only(page, False)
+        page.close()
+
+    def close(self):
+        """Close every idle tab"""
+        while self.idle:
+            self.discard(self.idle.pop())
+
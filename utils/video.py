@@ -0,0 +1,179 @@
+"""Failure-only video recording with background transcoding and a disk usage cap"""
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from playwright.sync_api import Error, Video
+
+VIDEO_MODES = ["off", "failures"]
+
+# Recording size; Playwright records at 25 fps, the frame rate is lowered when transcoding
+VIDEO_SIZE = {"width": 640, "height": 360}
+VIDEO_FPS = 10
+# Seconds kept from the end of a failing test's video
+VIDEO_TRIM_SECONDS = 30
+VIDEO_DISK_MB = 500
+VIDEO_ENCODE_WORKERS = 2
+
+
+def transcode(source: str, target: str, fps: int = VIDEO_FPS,
+              trim_seconds: int = VIDEO_TRIM_SECONDS) -> Tuple[int, float]:
+    """
+    Re-encode the last trim_seconds of a recording at a lower frame rate.
+
+    Runs in a pool process. Without ffmpeg (or if it fails) the raw
+    recording is moved to the target instead. Returns the size of the
+    source in bytes and the seconds spent.
+    """
+    start = time.perf_counter()
+    size = os.path.getsize(source)
+    ffmpeg = shutil.which("ffmpeg")
+    encoded = False
+    if ffmpeg:
+        command = [ffmpeg, "-y", "-loglevel", "error"]
+        if trim_seconds:
+            command += ["-sseof", f"-{trim_seconds}"]
+        command += [
+            "-i", source, "-an", "-r", str(fps),
+            "-c:v", "libvpx", "-deadline", "realtime", "-cpu-used", "8",
+            "-crf", "40", "-b:v", "200k", target,
+        ]
+        encoded = subprocess.run(command, capture_output=True).returncode == 0
+    if encoded:
+        os.unlink(source)
+    else:
+        shutil.move(source, target)
+    return size, time.perf_counter() - start
+
+
+class VideoStats:
+    """Counters of the video subsystem, mergeable across xdist workers"""
+
+    FIELDS = ["tests", "deleted", "encoded", "dropped", "overhead_seconds", "encoded_bytes", "encode_seconds"]
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def drain(self) -> Dict[str, float]:
+        """Get the counters and reset them, to ship them with a test report"""
+        counters = {field: getattr(self, field) for field in self.FIELDS}
+        self.clear()
+        return counters if any(counters.values()) else {}
+
+    def merge(self, counters: Dict[str, float]):
+        """Add counters drained in another process"""
+        for field, value in counters.items():
+            setattr(self, field, getattr(self, field) + value)
+
+    @property
+    def overhead_ms(self) -> float:
+        """Mean time added to a test's teardown by finalising its videos"""
+        return 1000 * self.overhead_seconds / self.tests if self.tests else 0.0
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Megabytes of raw recording transcoded per second of encoder time"""
+        return self.encoded_bytes / 1024 / 1024 / self.encode_seconds if self.encode_seconds else 0.0
+
+
+class VideoRecorder:
+    """
+    Records browser tests and keeps only the videos of failing ones.
+
+    Contexts record into a scratch directory. Once a test's context is
+    closed, videos of passing tests are deleted on the spot and those of
+    failing tests are trimmed and transcoded into output_dir by a process
+    pool. When output_dir grows past max_disk_mb the oldest videos
+    are dropped.
+    """
+
+    def __init__(self, output_dir: str, max_disk_mb: float = VIDEO_DISK_MB,
+                 size: Optional[dict] = None, workers: int = VIDEO_ENCODE_WORKERS):
+        self.output_dir = Path(output_dir)
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        self.size = size or VIDEO_SIZE
+        self.workers = workers
+        self.record_dir = tempfile.mkdtemp(prefix="videos-")
+        self.stats = VideoStats()
+        self.pending: List[Future] = []
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def context_args(self) -> dict:
+        """Context options that turn on recording"""
+        return {"record_video_dir": self.record_dir, "record_video_size": self.size}
+
+    def collect(self, videos: List[Video], nodeid: str, failed: bool):
+        """Delete or queue the videos of a test whose context was closed"""
+        start = time.perf_counter()
+        for index, video in enumerate(videos):
+            try:
+                if failed:
+                    self._submit(video.path(), self._target(nodeid, index))
+                else:
+                    video.delete()
+                    self.stats.deleted += 1
+            except Error:
+                pass  # Page did not produce any video frames
+        self.stats.tests += 1
+        self.stats.overhead_seconds += time.perf_counter() - start
+        self._reap()
+
+    def shutdown(self):
+        """Wait for queued encodes, apply the disk cap and remove the scratch directory"""
+        self._reap(wait=True)
+        if self._pool is not None:
+            self._pool.shutdown()
+        shutil.rmtree(self.record_dir, ignore_errors=True)
+
+    def _target(self, nodeid: str, index: int) -> str:
+        slug = re.sub(r"[^\w.-]+", "-", nodeid).strip("-")
+        return str(self.output_dir / f"{slug}-{index}.webm")
+
+    def _submit(self, source: str, target: str):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.pending.append(self._pool.submit(transcode, source, target))
+
+    def _reap(self, wait: bool = False):
+        """Record finished encodes and drop old videos past the disk cap"""
+        still_pending = []
+        for future in self.pending:
+            if not (wait or future.done()):
+                still_pending.append(future)
+                continue
+            try:
+                size, seconds = future.result()
+            except OSError:
+                continue
+            self.stats.encoded += 1
+            self.stats.encoded_bytes += size
+            self.stats.encode_seconds += seconds
+        finished = len(self.pending) - len(still_pending)
+        self.pending = still_pending
+        if finished:
+            self.stats.dropped += enforce_disk_cap(self.output_dir, self.max_disk_bytes)
+
+
+def enforce_disk_cap(directory: Path, max_bytes: float) -> int:
+    """Delete the oldest videos in a directory until it fits in max_bytes, returning how many went"""
+    videos = sorted(directory.glob("*.webm"), key=lambda path: path.stat().st_mtime)
+    total = sum(path.stat().st_size for path in videos)
+    dropped = 0
+    for path in videos:
+        if total <= max_bytes:
+            break
+        total -= path.stat().st_size
+        path.unlink()
+        dropped += 1
+    return dropped